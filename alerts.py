@@ -5,19 +5,36 @@ Provides persistence (SQLite), delta detection, and notification hooks
 for tracking Gumroad product changes.
 """
 
+import atexit
 import json
+import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent / "gumroad_alerts.db"
 
+# SQLite tuning applied to every connection. WAL lets dashboard reads run
+# alongside snapshot writes and defers fsync to checkpoints. The journal and
+# sync modes can be overridden via env (e.g. DELETE/FULL in tests).
+SQLITE_JOURNAL_MODE_ENV = "ALERTS_SQLITE_JOURNAL_MODE"
+SQLITE_SYNCHRONOUS_ENV = "ALERTS_SQLITE_SYNCHRONOUS"
+SQLITE_PRAGMAS = {
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,  # 256 MiB
+    "cache_size": -65536,  # 64 MiB (negative = KiB)
+    "busy_timeout": 5000,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class SavedSearch:
     """A saved search with query and filters."""
     id: Optional[int]
@@ -32,7 +49,7 @@ class SavedSearch:
     last_checked_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchlistItem:
     """A product URL or category to watch."""
     id: Optional[int]
@@ -42,7 +59,7 @@ class WatchlistItem:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductSnapshot:
     """A snapshot of a product at a point in time."""
     product_url: str
@@ -56,7 +73,7 @@ class ProductSnapshot:
     snapshot_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductChange:
     """Represents a change detected in a product."""
     product_url: str
@@ -67,15 +84,53 @@ class ProductChange:
     detected_at: str
 
 
+# Column lists in dataclass field order, so rows map positionally
+_SAVED_SEARCH_COLUMNS = (
+    "id, name, category, subcategory, min_price, max_price, "
+    "min_rating, min_reviews, created_at, last_checked_at"
+)
+_WATCHLIST_COLUMNS = "id, item_type, url, name, created_at"
+_SNAPSHOT_COLUMNS = (
+    "product_url, product_name, price_usd, average_rating, total_reviews, "
+    "sales_count, estimated_revenue, opportunity_score, snapshot_at"
+)
+
+
+def _saved_search_factory(cursor: sqlite3.Cursor, row: tuple) -> SavedSearch:
+    return SavedSearch(*row)
+
+
+def _watchlist_factory(cursor: sqlite3.Cursor, row: tuple) -> WatchlistItem:
+    return WatchlistItem(*row)
+
+
+def _snapshot_factory(cursor: sqlite3.Cursor, row: tuple) -> ProductSnapshot:
+    return ProductSnapshot(*row)
+
+
 # =============================================================================
 # Database Operations
 # =============================================================================
 
-def init_database(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Initialize the SQLite database with required tables."""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+def _apply_pragmas(conn: sqlite3.Connection, db_path: Path) -> None:
+    """Apply journal/sync/cache pragmas to a freshly opened connection."""
+    if str(db_path) != ":memory:":
+        journal_mode = os.environ.get(SQLITE_JOURNAL_MODE_ENV, "WAL")
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    synchronous = os.environ.get(SQLITE_SYNCHRONOUS_ENV, "NORMAL")
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    for name, value in SQLITE_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name}={value}")
+
+
+# Database paths whose schema and indexes this process has already brought
+# up to date, so the idempotent DDL runs once per path rather than per open
+_schema_ready: set[str] = set()
+_schema_lock = threading.Lock()
 
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create missing tables and indexes, and drop superseded ones."""
     cursor = conn.cursor()
 
     # Saved searches table
@@ -123,29 +178,115 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
         )
     """)
 
-    # Create indexes for faster lookups
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_snapshots_search_id
-        ON product_snapshots(search_id)
-    """)
+    # Create indexes for faster lookups. Snapshot reads always filter on
+    # search_id, so composite indexes turn them into index range scans.
+    cursor.execute("DROP INDEX IF EXISTS idx_snapshots_search_id")
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_snapshots_url
         ON product_snapshots(product_url)
     """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_snap_search_time
+        ON product_snapshots(search_id, snapshot_at DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_snap_search_url
+        ON product_snapshots(search_id, product_url)
+    """)
 
     conn.commit()
-    return conn
 
 
-def get_connection(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Get a database connection, initializing if needed."""
-    if not db_path.exists():
-        return init_database(db_path)
-    conn = sqlite3.connect(str(db_path))
+def _connect(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn, db_path)
+    return conn
+
+
+def init_database(
+    db_path: Path = DEFAULT_DB_PATH,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """Initialize the SQLite database with required tables."""
+    conn = _connect(db_path, check_same_thread)
+    with _schema_lock:
+        _ensure_schema(conn)
+        _schema_ready.add(str(db_path))
     return conn
 
 
+def open_connection(
+    db_path: Path = DEFAULT_DB_PATH,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """
+    Open a new, uncached connection, migrating the database if needed.
+    The caller owns the connection, e.g. ``with contextlib.closing(...)``.
+
+    The schema is checked on the first open of each path in this process,
+    so databases created by older versions also get the current indexes.
+    """
+    if str(db_path) == ":memory:" or str(db_path) not in _schema_ready:
+        return init_database(db_path, check_same_thread)
+    return _connect(db_path, check_same_thread)
+
+
+# One long-lived connection per db_path for the whole process, so the SQLite
+# page cache stays warm across CRUD calls and reruns. Streamlit runs reruns
+# on fresh threads and the app's write pool adds its own, so a per-thread
+# cache would keep opening connections; instead the shared one is opened
+# with check_same_thread=False and used only while holding _connection_lock.
+_connections: dict[str, sqlite3.Connection] = {}
+_connection_lock = threading.RLock()
+
+# Planner statistics are refreshed when a connection closes and, for a
+# long-running app, at most this often while it stays open.
+_OPTIMIZE_INTERVAL_SECONDS = 3600
+_optimized_at: dict[str, float] = {}
+
+
+def get_connection(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """
+    Get the process-wide connection for ``db_path``, opening it on first use.
+    Callers must not close it and should use it inside ``_locked_connection``
+    so statements from different threads do not interleave. Writes go in a
+    ``with conn:`` block so a failure rolls back rather than leaving an open
+    transaction for the next caller to commit.
+    """
+    key = str(db_path)
+    with _connection_lock:
+        conn = _connections.get(key)
+        if conn is None:
+            conn = _connections[key] = open_connection(db_path, check_same_thread=False)
+            _optimized_at[key] = time.monotonic()
+        elif time.monotonic() - _optimized_at[key] >= _OPTIMIZE_INTERVAL_SECONDS:
+            conn.execute("PRAGMA optimize")
+            _optimized_at[key] = time.monotonic()
+        return conn
+
+
+@contextmanager
+def _locked_connection(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Hold the shared connection for ``db_path`` for the length of the block."""
+    with _connection_lock:
+        yield get_connection(db_path)
+
+
+def close_connections() -> None:
+    """Close and forget all shared connections; they reopen on next use."""
+    with _connection_lock:
+        for conn in _connections.values():
+            # Refresh planner statistics for the tables this connection queried
+            conn.execute("PRAGMA optimize")
+            conn.close()
+        _connections.clear()
+        _optimized_at.clear()
+
+
+atexit.register(close_connections)
+
+
 # =============================================================================
 # Saved Searches CRUD
 # =============================================================================
@@ -161,100 +302,67 @@ def create_saved_search(
     db_path: Path = DEFAULT_DB_PATH,
 ) -> SavedSearch:
     """Create a new saved search."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    now = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc).isoformat()
 
-    cursor.execute("""
-        INSERT INTO saved_searches
-        (name, category, subcategory, min_price, max_price, min_rating, min_reviews, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (name, category, subcategory, min_price, max_price, min_rating, min_reviews, now))
+        with conn:
+            cursor.execute("""
+                INSERT INTO saved_searches
+                (name, category, subcategory, min_price, max_price, min_rating, min_reviews, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (name, category, subcategory, min_price, max_price, min_rating, min_reviews, now))
 
-    search_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-
-    return SavedSearch(
-        id=search_id,
-        name=name,
-        category=category,
-        subcategory=subcategory,
-        min_price=min_price,
-        max_price=max_price,
-        min_rating=min_rating,
-        min_reviews=min_reviews,
-        created_at=now,
-        last_checked_at=None,
-    )
+        search_id = cursor.lastrowid
+
+        return SavedSearch(
+            id=search_id,
+            name=name,
+            category=category,
+            subcategory=subcategory,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            min_reviews=min_reviews,
+            created_at=now,
+            last_checked_at=None,
+        )
 
 
 def get_saved_searches(db_path: Path = DEFAULT_DB_PATH) -> list[SavedSearch]:
     """Get all saved searches."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM saved_searches ORDER BY created_at DESC")
-    rows = cursor.fetchall()
-    conn.close()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _saved_search_factory
 
-    return [
-        SavedSearch(
-            id=row['id'],
-            name=row['name'],
-            category=row['category'],
-            subcategory=row['subcategory'],
-            min_price=row['min_price'],
-            max_price=row['max_price'],
-            min_rating=row['min_rating'],
-            min_reviews=row['min_reviews'],
-            created_at=row['created_at'],
-            last_checked_at=row['last_checked_at'],
-        )
-        for row in rows
-    ]
+        cursor.execute(f"SELECT {_SAVED_SEARCH_COLUMNS} FROM saved_searches ORDER BY created_at DESC")
+        return cursor.fetchall()
 
 
 def get_saved_search(search_id: int, db_path: Path = DEFAULT_DB_PATH) -> Optional[SavedSearch]:
     """Get a saved search by ID."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _saved_search_factory
 
-    cursor.execute("SELECT * FROM saved_searches WHERE id = ?", (search_id,))
-    row = cursor.fetchone()
-    conn.close()
-
-    if not row:
-        return None
-
-    return SavedSearch(
-        id=row['id'],
-        name=row['name'],
-        category=row['category'],
-        subcategory=row['subcategory'],
-        min_price=row['min_price'],
-        max_price=row['max_price'],
-        min_rating=row['min_rating'],
-        min_reviews=row['min_reviews'],
-        created_at=row['created_at'],
-        last_checked_at=row['last_checked_at'],
-    )
+        cursor.execute(f"SELECT {_SAVED_SEARCH_COLUMNS} FROM saved_searches WHERE id = ?", (search_id,))
+        return cursor.fetchone()
 
 
 def delete_saved_search(search_id: int, db_path: Path = DEFAULT_DB_PATH) -> bool:
     """Delete a saved search and its snapshots."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("DELETE FROM product_snapshots WHERE search_id = ?", (search_id,))
-    cursor.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
+        # Both deletes commit together or not at all
+        with conn:
+            cursor.execute("DELETE FROM product_snapshots WHERE search_id = ?", (search_id,))
+            cursor.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
 
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+        deleted = cursor.rowcount > 0
 
-    return deleted
+        return deleted
 
 
 def update_search_last_checked(
@@ -262,17 +370,15 @@ def update_search_last_checked(
     db_path: Path = DEFAULT_DB_PATH,
 ) -> None:
     """Update the last_checked_at timestamp for a search."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-
-    now = datetime.now(timezone.utc).isoformat()
-    cursor.execute(
-        "UPDATE saved_searches SET last_checked_at = ? WHERE id = ?",
-        (now, search_id)
-    )
-
-    conn.commit()
-    conn.close()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+
+        now = datetime.now(timezone.utc).isoformat()
+        with conn:
+            cursor.execute(
+                "UPDATE saved_searches SET last_checked_at = ? WHERE id = ?",
+                (now, search_id)
+            )
 
 
 # =============================================================================
@@ -286,72 +392,79 @@ def add_to_watchlist(
     db_path: Path = DEFAULT_DB_PATH,
 ) -> Optional[WatchlistItem]:
     """Add an item to the watchlist. Returns None if already exists."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    now = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc).isoformat()
 
-    try:
-        cursor.execute("""
-            INSERT INTO watchlist (item_type, url, name, created_at)
-            VALUES (?, ?, ?, ?)
-        """, (item_type, url, name, now))
+        # Duplicate URLs are ignored by the UNIQUE constraint and return no row
+        with conn:
+            cursor.execute("""
+                INSERT OR IGNORE INTO watchlist (item_type, url, name, created_at)
+                VALUES (?, ?, ?, ?)
+                RETURNING id
+            """, (item_type, url, name, now))
+            row = cursor.fetchone()
 
-        item_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        if row is None:
+            return None
 
         return WatchlistItem(
-            id=item_id,
+            id=row['id'],
             item_type=item_type,
             url=url,
             name=name,
             created_at=now,
         )
-    except sqlite3.IntegrityError:
-        conn.close()
-        return None
 
 
 def get_watchlist(db_path: Path = DEFAULT_DB_PATH) -> list[WatchlistItem]:
     """Get all watchlist items."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM watchlist ORDER BY created_at DESC")
-    rows = cursor.fetchall()
-    conn.close()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _watchlist_factory
 
-    return [
-        WatchlistItem(
-            id=row['id'],
-            item_type=row['item_type'],
-            url=row['url'],
-            name=row['name'],
-            created_at=row['created_at'],
-        )
-        for row in rows
-    ]
+        cursor.execute(f"SELECT {_WATCHLIST_COLUMNS} FROM watchlist ORDER BY created_at DESC")
+        return cursor.fetchall()
 
 
 def remove_from_watchlist(item_id: int, db_path: Path = DEFAULT_DB_PATH) -> bool:
     """Remove an item from the watchlist."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("DELETE FROM watchlist WHERE id = ?", (item_id,))
+        with conn:
+            cursor.execute("DELETE FROM watchlist WHERE id = ?", (item_id,))
 
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+        deleted = cursor.rowcount > 0
 
-    return deleted
+        return deleted
 
 
 # =============================================================================
 # Snapshot Operations
 # =============================================================================
 
+# Bound parameters per statement; SQLite builds before 3.32 capped this at 999
+SQLITE_MAX_VARIABLES = 32000
+
+_SNAPSHOT_INSERT_WIDTH = 10
+_SNAPSHOT_ROW_PLACEHOLDER = "(" + ", ".join(["?"] * _SNAPSHOT_INSERT_WIDTH) + ")"
+_SNAPSHOT_INSERT_SQL = """
+    INSERT INTO product_snapshots
+    (search_id, product_url, product_name, price_usd, average_rating,
+     total_reviews, sales_count, estimated_revenue, opportunity_score, snapshot_at)
+    VALUES """
+
+
+def _max_variables(conn: sqlite3.Connection) -> int:
+    """Return how many ``?`` parameters a single statement may bind."""
+    getlimit = getattr(conn, 'getlimit', None)  # Python 3.11+
+    if getlimit is None:
+        return 999
+    return min(SQLITE_MAX_VARIABLES, getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER))
+
+
 def save_snapshot(
     search_id: int,
     products: list[dict],
@@ -361,18 +474,9 @@ def save_snapshot(
     Save a snapshot of products for a search.
     Returns the number of products saved.
     """
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-
     now = datetime.now(timezone.utc).isoformat()
-
-    for p in products:
-        cursor.execute("""
-            INSERT INTO product_snapshots
-            (search_id, product_url, product_name, price_usd, average_rating,
-             total_reviews, sales_count, estimated_revenue, opportunity_score, snapshot_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    rows = [
+        (
             search_id,
             p.get('product_url', ''),
             p.get('product_name', ''),
@@ -383,13 +487,26 @@ def save_snapshot(
             p.get('estimated_revenue'),
             p.get('opportunity_score'),
             now,
-        ))
-
-    conn.commit()
-    conn.close()
+        )
+        for p in products
+    ]
 
-    # Update the last checked timestamp
-    update_search_last_checked(search_id, db_path)
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        rows_per_insert = _max_variables(conn) // _SNAPSHOT_INSERT_WIDTH
+
+        # One transaction for the whole snapshot plus the last_checked_at bump
+        with conn:
+            for start in range(0, len(rows), rows_per_insert):
+                chunk = rows[start:start + rows_per_insert]
+                cursor.execute(
+                    _SNAPSHOT_INSERT_SQL + ", ".join([_SNAPSHOT_ROW_PLACEHOLDER] * len(chunk)),
+                    [value for row in chunk for value in row],
+                )
+            cursor.execute(
+                "UPDATE saved_searches SET last_checked_at = ? WHERE id = ?",
+                (now, search_id)
+            )
 
     return len(products)
 
@@ -399,45 +516,21 @@ def get_latest_snapshot(
     db_path: Path = DEFAULT_DB_PATH,
 ) -> list[ProductSnapshot]:
     """Get the most recent snapshot for a search."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-
-    # Get the latest snapshot timestamp for this search
-    cursor.execute("""
-        SELECT MAX(snapshot_at) as latest FROM product_snapshots
-        WHERE search_id = ?
-    """, (search_id,))
-    result = cursor.fetchone()
-
-    if not result or not result['latest']:
-        conn.close()
-        return []
-
-    latest_time = result['latest']
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _snapshot_factory
+
+        # Fetch the rows of the newest snapshot in one statement
+        cursor.execute(f"""
+            SELECT {_SNAPSHOT_COLUMNS} FROM product_snapshots
+            WHERE search_id = ? AND snapshot_at = (
+                SELECT MAX(snapshot_at) FROM product_snapshots
+                WHERE search_id = ?
+            )
+            ORDER BY id
+        """, (search_id, search_id))
 
-    # Get all products from that snapshot
-    cursor.execute("""
-        SELECT * FROM product_snapshots
-        WHERE search_id = ? AND snapshot_at = ?
-    """, (search_id, latest_time))
-
-    rows = cursor.fetchall()
-    conn.close()
-
-    return [
-        ProductSnapshot(
-            product_url=row['product_url'],
-            product_name=row['product_name'],
-            price_usd=row['price_usd'],
-            average_rating=row['average_rating'],
-            total_reviews=row['total_reviews'],
-            sales_count=row['sales_count'],
-            estimated_revenue=row['estimated_revenue'],
-            opportunity_score=row['opportunity_score'],
-            snapshot_at=row['snapshot_at'],
-        )
-        for row in rows
-    ]
+        return cursor.fetchall()
 
 
 def get_previous_snapshot(
@@ -445,114 +538,143 @@ def get_previous_snapshot(
     db_path: Path = DEFAULT_DB_PATH,
 ) -> list[ProductSnapshot]:
     """Get the second-most-recent snapshot for a search (for comparison)."""
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
+    with _locked_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = _snapshot_factory
+
+        # Bind to the second-newest distinct timestamp in one statement
+        cursor.execute(f"""
+            SELECT {_SNAPSHOT_COLUMNS} FROM product_snapshots
+            WHERE search_id = ? AND snapshot_at = (
+                SELECT snapshot_at FROM product_snapshots
+                WHERE search_id = ?
+                GROUP BY snapshot_at
+                ORDER BY snapshot_at DESC
+                LIMIT 1 OFFSET 1
+            )
+            ORDER BY id
+        """, (search_id, search_id))
 
-    # Get distinct snapshot times, ordered descending
-    cursor.execute("""
-        SELECT DISTINCT snapshot_at FROM product_snapshots
-        WHERE search_id = ?
-        ORDER BY snapshot_at DESC
-        LIMIT 2
-    """, (search_id,))
-    results = cursor.fetchall()
+        return cursor.fetchall()
 
-    if len(results) < 2:
-        conn.close()
-        return []
 
-    previous_time = results[1]['snapshot_at']
+# =============================================================================
+# Delta Detection (Pure Functions)
+# =============================================================================
 
-    # Get all products from that snapshot
-    cursor.execute("""
-        SELECT * FROM product_snapshots
-        WHERE search_id = ? AND snapshot_at = ?
-    """, (search_id, previous_time))
+# Default thresholds shared by the detectors and the SQL-backed check
+PRICE_CHANGE_THRESHOLD_PERCENT = 5.0
+RATING_CHANGE_THRESHOLD = 0.2
+SALES_CHANGE_THRESHOLD_PERCENT = 10.0
 
-    rows = cursor.fetchall()
-    conn.close()
 
-    return [
-        ProductSnapshot(
-            product_url=row['product_url'],
-            product_name=row['product_name'],
-            price_usd=row['price_usd'],
-            average_rating=row['average_rating'],
-            total_reviews=row['total_reviews'],
-            sales_count=row['sales_count'],
-            estimated_revenue=row['estimated_revenue'],
-            opportunity_score=row['opportunity_score'],
-            snapshot_at=row['snapshot_at'],
-        )
-        for row in rows
-    ]
+def _is_price_change(old_price: float, new_price: float, threshold_percent: float) -> bool:
+    """Return True if the price moved by at least ``threshold_percent``."""
+    if old_price == 0 and new_price == 0:
+        return False
 
+    if old_price > 0:
+        change_percent = abs(new_price - old_price) / old_price * 100
+    else:
+        change_percent = 100  # From free to paid
 
-# =============================================================================
-# Delta Detection (Pure Functions)
-# =============================================================================
+    return change_percent >= threshold_percent
 
-def detect_new_products(
-    current_products: list[dict],
-    previous_snapshot: list[ProductSnapshot],
-) -> list[ProductChange]:
+
+def _is_rating_change(
+    old_rating: Optional[float],
+    new_rating: Optional[float],
+    threshold: float,
+) -> bool:
+    """Return True if both ratings are known and differ by at least ``threshold``."""
+    if old_rating is None or new_rating is None:
+        return False
+    return abs(new_rating - old_rating) >= threshold
+
+
+def _is_sales_change(
+    old_sales: Optional[int],
+    new_sales: Optional[int],
+    threshold_percent: float,
+) -> bool:
+    """Return True if sales grew by at least ``threshold_percent``."""
+    if old_sales is None or new_sales is None:
+        return False
+
+    if old_sales == 0:
+        if new_sales <= 0:
+            return False
+        change_percent = 100
+    else:
+        change_percent = (new_sales - old_sales) / old_sales * 100
+
+    return change_percent >= threshold_percent
+
+
+# Field order of the tuples produced by _extract_fields
+_ProductFields = tuple[str, Optional[str], Optional[float], Optional[float], Optional[int]]
+
+
+def _extract_fields(current_products: list[dict]) -> list[_ProductFields]:
     """
-    Detect new products that weren't in the previous snapshot.
-    Pure function - no side effects.
+    Pull the fields the detectors compare out of each product dict once.
+    Returns (url, name, price, rating, sales) tuples.
     """
-    previous_urls = {p.product_url for p in previous_snapshot}
-    now = datetime.now(timezone.utc).isoformat()
+    return [
+        (
+            p.get('product_url', ''),
+            p.get('product_name', 'Unknown'),
+            p.get('price_usd', 0),
+            p.get('average_rating'),
+            p.get('sales_count'),
+        )
+        for p in current_products
+    ]
 
-    changes = []
-    for product in current_products:
-        url = product.get('product_url', '')
-        if url and url not in previous_urls:
-            changes.append(ProductChange(
-                product_url=url,
-                product_name=product.get('product_name', 'Unknown'),
-                change_type='new',
-                old_value=None,
-                new_value=f"${product.get('price_usd', 0):.2f}",
-                detected_at=now,
-            ))
 
-    return changes
+def _index_by_url(previous_snapshot: list[ProductSnapshot]) -> dict[str, ProductSnapshot]:
+    """Map snapshot rows by URL; a later duplicate URL wins."""
+    return {p.product_url: p for p in previous_snapshot}
 
 
-def detect_price_changes(
-    current_products: list[dict],
-    previous_snapshot: list[ProductSnapshot],
-    threshold_percent: float = 5.0,
+def _new_products(
+    rows: list[_ProductFields],
+    previous_by_url: dict[str, ProductSnapshot],
+    now: str,
 ) -> list[ProductChange]:
-    """
-    Detect significant price changes.
-    Pure function - no side effects.
-    """
-    previous_by_url = {p.product_url: p for p in previous_snapshot}
-    now = datetime.now(timezone.utc).isoformat()
+    return [
+        ProductChange(
+            product_url=url,
+            product_name=name,
+            change_type='new',
+            old_value=None,
+            new_value=f"${price:.2f}",
+            detected_at=now,
+        )
+        for url, name, price, _rating, _sales in rows
+        if url and url not in previous_by_url
+    ]
+
 
+def _price_changes(
+    rows: list[_ProductFields],
+    previous_by_url: dict[str, ProductSnapshot],
+    threshold_percent: float,
+    now: str,
+) -> list[ProductChange]:
     changes = []
-    for product in current_products:
-        url = product.get('product_url', '')
-        if url not in previous_by_url:
+    for url, name, price, _rating, _sales in rows:
+        prev = previous_by_url.get(url)
+        if prev is None:
             continue
 
-        prev = previous_by_url[url]
         old_price = prev.price_usd or 0
-        new_price = product.get('price_usd', 0) or 0
-
-        if old_price == 0 and new_price == 0:
-            continue
+        new_price = price or 0
 
-        if old_price > 0:
-            change_percent = abs(new_price - old_price) / old_price * 100
-        else:
-            change_percent = 100  # From free to paid
-
-        if change_percent >= threshold_percent:
+        if _is_price_change(old_price, new_price, threshold_percent):
             changes.append(ProductChange(
                 product_url=url,
-                product_name=product.get('product_name', 'Unknown'),
+                product_name=name,
                 change_type='price_change',
                 old_value=f"${old_price:.2f}",
                 new_value=f"${new_price:.2f}",
@@ -562,35 +684,24 @@ def detect_price_changes(
     return changes
 
 
-def detect_rating_changes(
-    current_products: list[dict],
-    previous_snapshot: list[ProductSnapshot],
-    threshold: float = 0.2,
+def _rating_changes(
+    rows: list[_ProductFields],
+    previous_by_url: dict[str, ProductSnapshot],
+    threshold: float,
+    now: str,
 ) -> list[ProductChange]:
-    """
-    Detect significant rating changes.
-    Pure function - no side effects.
-    """
-    previous_by_url = {p.product_url: p for p in previous_snapshot}
-    now = datetime.now(timezone.utc).isoformat()
-
     changes = []
-    for product in current_products:
-        url = product.get('product_url', '')
-        if url not in previous_by_url:
+    for url, name, _price, new_rating, _sales in rows:
+        prev = previous_by_url.get(url)
+        if prev is None:
             continue
 
-        prev = previous_by_url[url]
         old_rating = prev.average_rating
-        new_rating = product.get('average_rating')
 
-        if old_rating is None or new_rating is None:
-            continue
-
-        if abs(new_rating - old_rating) >= threshold:
+        if _is_rating_change(old_rating, new_rating, threshold):
             changes.append(ProductChange(
                 product_url=url,
-                product_name=product.get('product_name', 'Unknown'),
+                product_name=name,
                 change_type='rating_change',
                 old_value=f"{old_rating:.1f}",
                 new_value=f"{new_rating:.1f}",
@@ -600,43 +711,24 @@ def detect_rating_changes(
     return changes
 
 
-def detect_sales_changes(
-    current_products: list[dict],
-    previous_snapshot: list[ProductSnapshot],
-    threshold_percent: float = 10.0,
+def _sales_changes(
+    rows: list[_ProductFields],
+    previous_by_url: dict[str, ProductSnapshot],
+    threshold_percent: float,
+    now: str,
 ) -> list[ProductChange]:
-    """
-    Detect significant sales count changes.
-    Pure function - no side effects.
-    """
-    previous_by_url = {p.product_url: p for p in previous_snapshot}
-    now = datetime.now(timezone.utc).isoformat()
-
     changes = []
-    for product in current_products:
-        url = product.get('product_url', '')
-        if url not in previous_by_url:
+    for url, name, _price, _rating, new_sales in rows:
+        prev = previous_by_url.get(url)
+        if prev is None:
             continue
 
-        prev = previous_by_url[url]
         old_sales = prev.sales_count
-        new_sales = product.get('sales_count')
-
-        if old_sales is None or new_sales is None:
-            continue
 
-        if old_sales == 0:
-            if new_sales > 0:
-                change_percent = 100
-            else:
-                continue
-        else:
-            change_percent = (new_sales - old_sales) / old_sales * 100
-
-        if change_percent >= threshold_percent:
+        if _is_sales_change(old_sales, new_sales, threshold_percent):
             changes.append(ProductChange(
                 product_url=url,
-                product_name=product.get('product_name', 'Unknown'),
+                product_name=name,
                 change_type='sales_change',
                 old_value=str(old_sales),
                 new_value=str(new_sales),
@@ -646,22 +738,151 @@ def detect_sales_changes(
     return changes
 
 
-def detect_all_changes(
+def detect_new_products(
     current_products: list[dict],
     previous_snapshot: list[ProductSnapshot],
+    detected_at: Optional[str] = None,
 ) -> list[ProductChange]:
     """
-    Detect all types of changes between current products and previous snapshot.
+    Detect new products that weren't in the previous snapshot.
     Pure function - no side effects.
     """
+    now = detected_at or datetime.now(timezone.utc).isoformat()
+    return _new_products(_extract_fields(current_products), _index_by_url(previous_snapshot), now)
+
+
+def detect_price_changes(
+    current_products: list[dict],
+    previous_snapshot: list[ProductSnapshot],
+    threshold_percent: float = PRICE_CHANGE_THRESHOLD_PERCENT,
+    detected_at: Optional[str] = None,
+) -> list[ProductChange]:
+    """
+    Detect significant price changes.
+    Pure function - no side effects.
+    """
+    now = detected_at or datetime.now(timezone.utc).isoformat()
+    return _price_changes(_extract_fields(current_products), _index_by_url(previous_snapshot), threshold_percent, now)
+
+
+def detect_rating_changes(
+    current_products: list[dict],
+    previous_snapshot: list[ProductSnapshot],
+    threshold: float = RATING_CHANGE_THRESHOLD,
+    detected_at: Optional[str] = None,
+) -> list[ProductChange]:
+    """
+    Detect significant rating changes.
+    Pure function - no side effects.
+    """
+    now = detected_at or datetime.now(timezone.utc).isoformat()
+    return _rating_changes(_extract_fields(current_products), _index_by_url(previous_snapshot), threshold, now)
+
+
+def detect_sales_changes(
+    current_products: list[dict],
+    previous_snapshot: list[ProductSnapshot],
+    threshold_percent: float = SALES_CHANGE_THRESHOLD_PERCENT,
+    detected_at: Optional[str] = None,
+) -> list[ProductChange]:
+    """
+    Detect significant sales count changes.
+    Pure function - no side effects.
+    """
+    now = detected_at or datetime.now(timezone.utc).isoformat()
+    return _sales_changes(_extract_fields(current_products), _index_by_url(previous_snapshot), threshold_percent, now)
+
+
+def _all_changes(
+    rows: list[_ProductFields],
+    previous_by_url: dict[str, ProductSnapshot],
+    price_threshold_percent: float,
+    rating_threshold: float,
+    sales_threshold_percent: float,
+    now: str,
+) -> list[ProductChange]:
     changes = []
-    changes.extend(detect_new_products(current_products, previous_snapshot))
-    changes.extend(detect_price_changes(current_products, previous_snapshot))
-    changes.extend(detect_rating_changes(current_products, previous_snapshot))
-    changes.extend(detect_sales_changes(current_products, previous_snapshot))
+    changes.extend(_new_products(rows, previous_by_url, now))
+    changes.extend(_price_changes(rows, previous_by_url, price_threshold_percent, now))
+    changes.extend(_rating_changes(rows, previous_by_url, rating_threshold, now))
+    changes.extend(_sales_changes(rows, previous_by_url, sales_threshold_percent, now))
     return changes
 
 
+def detect_all_changes(
+    current_products: list[dict],
+    previous_snapshot: list[ProductSnapshot],
+    price_threshold_percent: float = PRICE_CHANGE_THRESHOLD_PERCENT,
+    rating_threshold: float = RATING_CHANGE_THRESHOLD,
+    sales_threshold_percent: float = SALES_CHANGE_THRESHOLD_PERCENT,
+) -> list[ProductChange]:
+    """
+    Detect all types of changes between current products and previous snapshot.
+    Pure function - no side effects.
+    """
+    return _all_changes(
+        _extract_fields(current_products),
+        _index_by_url(previous_snapshot),
+        price_threshold_percent,
+        rating_threshold,
+        sales_threshold_percent,
+        datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _detect_changes_in_db(
+    conn: sqlite3.Connection,
+    search_id: int,
+    snapshot_at: Optional[str],
+    current_products: list[dict],
+) -> list[ProductChange]:
+    """
+    Equivalent of ``detect_all_changes`` against a stored snapshot.
+
+    The current products are staged in a temp table and the snapshot's
+    latest row for each of their URLs is fetched in one grouped query, so
+    only the rows being compared leave SQLite. The comparison itself is the
+    same pass ``detect_all_changes`` makes.
+    """
+    rows = _extract_fields(current_products)
+    cursor = conn.cursor()
+    cursor.row_factory = _snapshot_factory
+    # Staging and lookup run in one transaction so nothing is left open on error
+    with conn:
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS current_products (url TEXT)
+        """)
+        cursor.execute("DELETE FROM temp.current_products")
+        cursor.executemany(
+            "INSERT INTO temp.current_products (url) VALUES (?)",
+            [(row[0],) for row in rows],
+        )
+
+        # When a URL was stored more than once the latest row wins, as with
+        # a URL-keyed dict
+        cursor.execute(f"""
+            WITH latest AS (
+                SELECT MAX(id) AS id FROM product_snapshots
+                WHERE search_id = ? AND snapshot_at = ?
+                  AND product_url IN (SELECT url FROM temp.current_products)
+                GROUP BY product_url
+            )
+            SELECT {_SNAPSHOT_COLUMNS} FROM latest
+            JOIN product_snapshots USING (id)
+        """, (search_id, snapshot_at))
+        previous = cursor.fetchall()
+        cursor.execute("DELETE FROM temp.current_products")
+
+    return _all_changes(
+        rows,
+        _index_by_url(previous),
+        PRICE_CHANGE_THRESHOLD_PERCENT,
+        RATING_CHANGE_THRESHOLD,
+        SALES_CHANGE_THRESHOLD_PERCENT,
+        datetime.now(timezone.utc).isoformat(),
+    )
+
+
 def check_for_updates(
     search_id: int,
     current_products: list[dict],
@@ -672,26 +893,63 @@ def check_for_updates(
     Saves the current products as a new snapshot.
     Returns list of detected changes.
     """
-    # Get previous snapshot
-    previous = get_previous_snapshot(search_id, db_path)
-
-    # If no previous snapshot, get the latest (which will be the only one)
-    if not previous:
-        previous = get_latest_snapshot(search_id, db_path)
+    with _locked_connection(db_path) as conn:
+        # Compare against the previous snapshot, or the latest if it is the only one
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT snapshot_at FROM product_snapshots
+            WHERE search_id = ?
+            GROUP BY snapshot_at
+            ORDER BY snapshot_at DESC
+            LIMIT 2
+        """, (search_id,))
+        snapshot_times = cursor.fetchall()
+        baseline_at = snapshot_times[-1]['snapshot_at'] if snapshot_times else None
 
-    # Detect changes
-    changes = detect_all_changes(current_products, previous)
+        # Detect changes
+        changes = _detect_changes_in_db(conn, search_id, baseline_at, current_products)
 
-    # Save new snapshot
-    save_snapshot(search_id, current_products, db_path)
+        # Save new snapshot
+        save_snapshot(search_id, current_products, db_path)
 
-    return changes
+        return changes
 
 
 # =============================================================================
 # Notification Hooks (Placeholder Functions)
 # =============================================================================
 
+SLACK_EMOJI = {
+    'new': ':new:',
+    'price_change': ':moneybag:',
+    'rating_change': ':star:',
+    'sales_change': ':chart_with_upwards_trend:',
+}
+
+CHANGE_ICONS = {
+    'new': '🆕',
+    'price_change': '💰',
+    'rating_change': '⭐',
+    'sales_change': '📈',
+}
+DEFAULT_CHANGE_ICON = '🔔'
+
+CHANGE_LABELS = {
+    'new': 'New Product',
+    'price_change': 'Price Change',
+    'rating_change': 'Rating Change',
+    'sales_change': 'Sales Change',
+}
+
+
+def change_label(change_type: str) -> str:
+    """Human-readable label for a change type, e.g. 'price_change' -> 'Price Change'."""
+    label = CHANGE_LABELS.get(change_type)
+    if label is None:
+        label = change_type.replace('_', ' ').title()
+    return label
+
+
 def notify_email(
     to_address: str,
     subject: str,
@@ -745,20 +1003,17 @@ def notify_slack(
     # Format as Slack-like message
     message_lines = []
     for change in changes:
-        emoji = {
-            'new': ':new:',
-            'price_change': ':moneybag:',
-            'rating_change': ':star:',
-            'sales_change': ':chart_with_upwards_trend:',
-        }.get(change.change_type, ':bell:')
+        change_type = change.change_type
+        emoji = SLACK_EMOJI.get(change_type, ':bell:')
+        label = change_label(change_type)
 
-        if change.change_type == 'new':
+        if change_type == 'new':
             message_lines.append(
-                f"{emoji} *New Product*: {change.product_name} ({change.new_value})"
+                f"{emoji} *{label}*: {change.product_name} ({change.new_value})"
             )
         else:
             message_lines.append(
-                f"{emoji} *{change.change_type.replace('_', ' ').title()}*: "
+                f"{emoji} *{label}*: "
                 f"{change.product_name} ({change.old_value} -> {change.new_value})"
             )
 
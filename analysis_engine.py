@@ -11,6 +11,16 @@ import json
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+# Built on first use by _get_agent and shared by every CrewAnalyzer.
+_LLM: Any | None = None
+_AGENT: Any | None = None
+
 
 @dataclass
 class AnalysisResult:
@@ -76,29 +86,9 @@ class CrewAnalyzer:
         ]
 
     def _default_crew_builder(self, tasks: List[Dict[str, str]]):  # pragma: no cover - requires CrewAI runtime
-        from crewai import Agent, Crew, Process, Task
-
-        try:
-            from langchain_openai import ChatOpenAI  # type: ignore
-
-            llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
-        except Exception:
-            # Fallback to letting CrewAI pick a default LLM if langchain-openai
-            # is not available in the environment.
-            llm = None
-
-        analyst = Agent(
-            role="Gumroad Market Analyst",
-            goal="Spot patterns in scraped Gumroad listings and summarise them",
-            backstory=(
-                "You review digital product listings and synthesise insights about"
-                " what categories are trending, which listings are outperforming,"
-                " and how pricing or sentiment impacts performance."
-            ),
-            verbose=False,
-            llm=llm,
-        )
+        from crewai import Crew, Process, Task
 
+        analyst = _get_agent()
         crew_tasks = [
             Task(description=item["prompt"], expected_output=item["expected_output"], agent=analyst)
             for item in tasks
@@ -117,14 +107,53 @@ class CrewAnalyzer:
         return {"summary": "Analysis complete."}
 
 
+def _get_agent():  # pragma: no cover - requires CrewAI runtime
+    """Return the shared analyst agent, creating it and its LLM client once."""
+
+    global _LLM, _AGENT
+    if _AGENT is not None:
+        return _AGENT
+
+    from crewai import Agent
+
+    try:
+        from langchain_openai import ChatOpenAI  # type: ignore
+
+        _LLM = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+    except Exception:
+        # Fallback to letting CrewAI pick a default LLM if langchain-openai
+        # is not available in the environment.
+        _LLM = None
+
+    _AGENT = Agent(
+        role="Gumroad Market Analyst",
+        goal="Spot patterns in scraped Gumroad listings and summarise them",
+        backstory=(
+            "You review digital product listings and synthesise insights about"
+            " what categories are trending, which listings are outperforming,"
+            " and how pricing or sentiment impacts performance."
+        ),
+        verbose=False,
+        llm=_LLM,
+    )
+    return _AGENT
+
+
+def _canonical_row_bytes(row: Dict[str, Any]) -> bytes:
+    """Serialize a row deterministically (sorted keys) for hashing."""
+
+    if orjson is not None:
+        return orjson.dumps(row, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(row, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
 def dataset_cache_key(products: Iterable[Dict[str, Any]], dataset_id: str) -> str:
     """Return a stable cache key for a dataset."""
 
-    hasher = hashlib.sha256()
+    hasher = hashlib.blake2b(digest_size=32)
     hasher.update(dataset_id.encode("utf-8"))
     for row in products:
-        serialized = json.dumps(row, sort_keys=True, ensure_ascii=False)
-        hasher.update(serialized.encode("utf-8"))
+        hasher.update(_canonical_row_bytes(row))
     return hasher.hexdigest()
 
 
@@ -1,38 +1,76 @@
 """Streamlit helpers for running CrewAI analysis and rendering insights."""
 from __future__ import annotations
 
+import hashlib
 from dataclasses import asdict, is_dataclass
-from typing import Any, Iterable, List, Sequence
+from typing import Any, Callable, Iterable, List, Sequence
 
+import pandas as pd
 import streamlit as st
 
 from analysis_engine import AnalysisResult, CrewAnalyzer, dataset_cache_key
+from gumroad_scraper import Product, product_to_dict
 
 _analyzer = CrewAnalyzer()
 
 
+def _row_converter(row: Any) -> Callable[[Any], dict]:
+    """Return the function turning rows shaped like ``row`` into row dicts."""
+    if isinstance(row, Product):
+        return product_to_dict
+    if isinstance(row, dict):
+        return lambda product: product
+    if is_dataclass(row):
+        return asdict
+    return dict
+
+
 def _to_rows(products: Iterable[Any]) -> List[dict]:
-    rows: List[dict] = []
-    for product in products:
-        if is_dataclass(product):
-            rows.append(asdict(product))
-        elif isinstance(product, dict):
-            rows.append(product)
-        else:
-            rows.append(dict(product))
-    return rows
+    """Return ``products`` as row dicts, choosing the conversion from the first row.
+
+    A dataset normally holds one kind of row (Products or scored dicts), so
+    the converter is picked once; a row of another type falls back to its own.
+    """
+    products = list(products)
+    if not products:
+        return []
+    row_type = type(products[0])
+    convert = _row_converter(products[0])
+    return [
+        convert(product) if type(product) is row_type else _row_converter(product)(product)
+        for product in products
+    ]
+
+
+def _frame_cache_key(frame: pd.DataFrame, dataset_id: str) -> str:
+    """Return a content hash of ``frame`` without building per-row dicts."""
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update(dataset_id.encode("utf-8"))
+    hasher.update(repr(list(frame.columns)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
 
 
 @st.cache_data(show_spinner=False)
-def _cached_analysis(cache_key: str, rows: Sequence[dict], source_label: str) -> AnalysisResult:
-    return _analyzer.analyze(rows, cache_key, source_label)
+def _cached_analysis(cache_key: str, _rows: Sequence[dict], source_label: str) -> AnalysisResult:
+    # cache_key is already a content hash of the rows, so the leading
+    # underscore keeps Streamlit from pickling and hashing them again.
+    return _analyzer.analyze(_rows, cache_key, source_label)
 
 
 def render_analysis_block(products: Iterable[Any], dataset_id: str, source_label: str, *, button_label: str = "🔎 Analyze"):
-    """Render an Analyze button and display CrewAI insights when available."""
+    """Render an Analyze button and display CrewAI insights when available.
 
-    rows = _to_rows(products)
-    cache_key = dataset_cache_key(rows, dataset_id)
+    ``products`` may also be a DataFrame, in which case it is hashed column-wise
+    and only turned into row dicts when the analysis actually runs.
+    """
+
+    if isinstance(products, pd.DataFrame):
+        rows = None
+        cache_key = _frame_cache_key(products, dataset_id)
+    else:
+        rows = _to_rows(products)
+        cache_key = dataset_cache_key(rows, dataset_id)
     session_key = f"analysis-result-{cache_key}"
     trigger_key = f"analysis-trigger-{cache_key}"
 
@@ -40,6 +78,8 @@ def render_analysis_block(products: Iterable[Any], dataset_id: str, source_label
         st.session_state[trigger_key] = True
 
     if st.session_state.get(trigger_key):
+        if rows is None:
+            rows = products.to_dict(orient="records")
         with st.spinner("Running CrewAI analysis... this may take a moment"):
             st.session_state[session_key] = _cached_analysis(cache_key, rows, source_label)
         st.session_state[trigger_key] = False
@@ -1,6 +1,27 @@
 """Quick script to analyze Gumroad page structure."""
 import asyncio
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeout, async_playwright
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # selectolax is optional; probe the live page instead
+    HTMLParser = None
+
+
+def probe_selectors_offline(html: str, selectors: list[str]) -> list[dict]:
+    """Count matches for each selector in already-fetched HTML."""
+    tree = HTMLParser(html)
+    stats = []
+    for selector in selectors:
+        elements = tree.css(selector)
+        first = elements[0] if elements else None
+        stats.append({
+            'selector': selector,
+            'count': len(elements),
+            'tag': first.tag.upper() if first else None,
+            'className': first.attributes.get('class') if first else None,
+        })
+    return stats
 
 
 async def analyze_gumroad():
@@ -9,8 +30,13 @@ async def analyze_gumroad():
         page = await browser.new_page()
 
         print("Loading Gumroad discover page...")
-        await page.goto('https://gumroad.com/discover', wait_until='networkidle', timeout=30000)
-        await page.wait_for_timeout(3000)
+        # networkidle never settles while analytics beacons keep firing, so
+        # gate on the DOM plus the first product link instead
+        await page.goto('https://gumroad.com/discover', wait_until='domcontentloaded', timeout=15000)
+        try:
+            await page.wait_for_selector('a[href*="/l/"]', timeout=10000)
+        except PlaywrightTimeout:
+            print("No product links rendered within 10s; analyzing page as-is")
 
         # Take screenshot
         await page.screenshot(path='gumroad_screenshot.png', full_page=False)
@@ -41,24 +67,37 @@ async def analyze_gumroad():
             '[class*="grid"] > *',
         ]
 
-        for selector in selectors_to_try:
-            elements = await page.query_selector_all(selector)
-            if elements:
-                print(f"'{selector}': {len(elements)} elements found")
-                if len(elements) > 0 and len(elements) < 50:
-                    first = elements[0]
-                    class_name = await first.get_attribute('class')
-                    tag = await first.evaluate('el => el.tagName')
-                    print(f"  First element: <{tag}> class='{class_name}'")
+        if HTMLParser is not None:
+            # The HTML is already in hand, so no further browser round-trips
+            selector_stats = probe_selectors_offline(html, selectors_to_try)
+        else:
+            # Count every selector (and describe its first match) in one round-trip
+            selector_stats = await page.evaluate(
+                """selectors => selectors.map(selector => {
+                    const elements = document.querySelectorAll(selector);
+                    const first = elements[0];
+                    return {
+                        selector,
+                        count: elements.length,
+                        tag: first ? first.tagName : null,
+                        className: first ? first.getAttribute('class') : null,
+                    };
+                })""",
+                selectors_to_try,
+            )
+
+        for stats in selector_stats:
+            if stats['count']:
+                print(f"'{stats['selector']}': {stats['count']} elements found")
+                if stats['count'] < 50:
+                    print(f"  First element: <{stats['tag']}> class='{stats['className']}'")
 
         # Find links to products
         print("\n=== Product links ===")
-        links = await page.query_selector_all('a')
-        product_links = []
-        for link in links:
-            href = await link.get_attribute('href')
-            if href and '/l/' in href:
-                product_links.append(href)
+        product_links = await page.eval_on_selector_all(
+            'a[href*="/l/"]',
+            'els => els.map(el => el.getAttribute("href"))',
+        )
         print(f"Found {len(product_links)} product links")
         if product_links:
             print(f"Sample: {product_links[:3]}")
@@ -5,26 +5,46 @@ Includes opportunity scoring, saved searches, and watchlists.
 """
 
 import asyncio
+import atexit
+import io
 import sys
+import threading
+import time
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
 
 # Fix for Python 3.14+ on Windows - ensure ProactorEventLoop is used for subprocess support
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
-from dataclasses import asdict
+from operator import attrgetter
+from playwright.async_api import Browser, Playwright, async_playwright
 
 from analysis_ui import render_analysis_block
-from categories import CATEGORY_BY_LABEL, CATEGORY_TREE, Category, Subcategory, build_discover_url
+from categories import (
+    CATEGORY_BY_LABEL,
+    CATEGORY_LABELS,
+    SUBCATEGORY_LABELS,
+    SUBCATEGORY_SLUGS,
+    Category,
+    Subcategory,
+    build_discover_url,
+)
 from gumroad_scraper import (
+    launch_browser,
     scrape_discover_page,
     Product,
+    PRODUCT_FIELDS,
+    product_to_dict,
 )
 from opportunity_scoring import (
-    score_product_dict,
-    get_top_scored_products,
+    score_product_dicts,
     get_score_breakdown,
 )
 from alerts import (
@@ -38,8 +58,13 @@ from alerts import (
     get_latest_snapshot,
     check_for_updates,
     send_digest,
+    change_label,
     SavedSearch,
+    WatchlistItem,
+    CHANGE_ICONS,
+    DEFAULT_CHANGE_ICON,
 )
+from scrape_cache import cache_path, clear_results, discard_results, load_results, store_results
 from supabase_utils import SupabaseRunStore, get_supabase_client
 from scripts.full_gumroad_scrape import scrape_all_categories
 
@@ -57,10 +82,9 @@ st.markdown("Scrape product data from Gumroad discover pages with opportunity sc
 st.sidebar.header("Settings")
 
 
-category_options = [cat.label for cat in CATEGORY_TREE]
 category_label = st.sidebar.selectbox(
     "Category",
-    options=category_options,
+    options=CATEGORY_LABELS,
     index=0,
 )
 
@@ -85,13 +109,12 @@ if st.session_state.last_category != category_label:
 
 subcategory_label = st.sidebar.selectbox(
     "Subcategory",
-    options=[subcategory.label for subcategory in subcategory_options],
+    options=SUBCATEGORY_LABELS[category_label],
     format_func=lambda value: value if value == "All Subcategories" else f" • {value}",
     key="subcategory_choice",
 )
 
-subcategory_slug_lookup = {subcategory.label: subcategory.slug for subcategory in subcategory_options}
-subcategory_slug = subcategory_slug_lookup.get(subcategory_label, "")
+subcategory_slug = SUBCATEGORY_SLUGS[category_label].get(subcategory_label, "")
 
 max_products = st.sidebar.number_input(
     "Max Products",
@@ -114,12 +137,28 @@ rate_limit = st.sidebar.slider(
     max_value=2000,
     value=500,
     step=100,
-    help="Delay between requests to avoid detection",
+    help="Minimum gap between product page requests to avoid detection",
+)
+
+max_concurrency = st.sidebar.slider(
+    "Concurrent Pages",
+    min_value=1,
+    max_value=10,
+    value=5,
+    step=1,
+    help="Product pages loaded at once; requests still start no faster than the rate limit",
+)
+
+force_refresh = st.sidebar.checkbox(
+    "Force Refresh",
+    value=False,
+    help="Scrape again even if the same search ran within the last hour",
 )
 
 st.sidebar.markdown("---")
 if st.sidebar.button("Clear Cache", use_container_width=True):
     st.cache_data.clear()
+    clear_results()
     st.session_state.results = None
     st.session_state.scored_results = None
     st.session_state.current_run_id = None
@@ -132,14 +171,24 @@ if "scored_results" not in st.session_state:
     st.session_state.scored_results = None
 if "scraping" not in st.session_state:
     st.session_state.scraping = False
-if "detected_changes" not in st.session_state:
-    st.session_state.detected_changes = None
+if "detected_changes_table" not in st.session_state:
+    st.session_state.detected_changes_table = None
 if "current_run_id" not in st.session_state:
     st.session_state.current_run_id = None
+if "cached_results_key" not in st.session_state:
+    st.session_state.cached_results_key = None
 if "current_category_slug" not in st.session_state:
     st.session_state.current_category_slug = None
 if "current_subcategory_slug" not in st.session_state:
     st.session_state.current_subcategory_slug = None
+if "results_frame" not in st.session_state:
+    st.session_state.results_frame = None
+if "summary_metrics" not in st.session_state:
+    st.session_state.summary_metrics = None
+if "ranked_results" not in st.session_state:
+    st.session_state.ranked_results = None
+if "saved_searches_editor_version" not in st.session_state:
+    st.session_state.saved_searches_editor_version = 0
 
 
 @st.cache_resource
@@ -150,6 +199,12 @@ def get_run_store() -> tuple[SupabaseRunStore, str]:
     return SupabaseRunStore(None), "local"
 
 
+@st.cache_resource
+def get_write_pool() -> ThreadPoolExecutor:
+    """Threads for database writes the user does not need to wait on."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="snapshot-writer")
+
+
 run_store, storage_mode = get_run_store()
 storage_label = "Supabase" if storage_mode == "supabase" else "Local (no persistence)"
 badge_color = "#16a34a" if storage_mode == "supabase" else "#f97316"
@@ -162,318 +217,476 @@ if st.session_state.current_run_id:
     st.caption(f"Current run ID: {st.session_state.current_run_id}")
 
 
+# Snapshot columns the results view uses, mapped to the scraper's field names.
+# Matches the columns SupabaseRunStore.fetch_snapshots selects.
+RUN_RESULT_COLUMNS = {
+    "url": "product_url",
+    "title": "product_name",
+    "creator_name": "creator_name",
+    "category": "category",
+    "subcategory": "subcategory",
+    "price_amount": "price_usd",
+    "price_currency": "currency",
+    "rating_avg": "average_rating",
+    "rating_count": "total_reviews",
+    "sales_count": "sales_count",
+    "revenue_estimate": "estimated_revenue",
+    "opportunity_score": "opportunity_score",
+}
+
+
 def load_run_results(run_id: str, category_slug: str, subcategory_slug: str | None, store: SupabaseRunStore) -> pd.DataFrame:
     data = store.fetch_snapshots(run_id, category=category_slug, subcategory=subcategory_slug or None)
     if not data:
         return pd.DataFrame()
 
-    df = pd.DataFrame(data)
-    df = df.rename(
-        columns={
-            "title": "product_name",
-            "url": "product_url",
-            "price_amount": "price_usd",
-            "rating_avg": "average_rating",
-            "rating_count": "total_reviews",
-            "revenue_estimate": "estimated_revenue",
-        }
-    )
-    for required in [
-        "product_name",
-        "product_url",
-        "creator_name",
-        "category",
-        "subcategory",
-        "price_usd",
-        "average_rating",
-        "total_reviews",
-        "sales_count",
-        "estimated_revenue",
-        "opportunity_score",
-    ]:
-        if required not in df:
-            df[required] = None
-    for numeric_col in [
-        "price_usd",
-        "average_rating",
-        "total_reviews",
-        "sales_count",
-        "estimated_revenue",
-        "opportunity_score",
-    ]:
-        df[numeric_col] = pd.to_numeric(df[numeric_col], errors="coerce") if numeric_col in df else None
+    # The allow-list builds exactly these columns (absent keys become
+    # missing values); relabelling them afterwards is free
+    df = pd.DataFrame.from_records(data, columns=list(RUN_RESULT_COLUMNS), nrows=len(data))
+    df.columns = list(RUN_RESULT_COLUMNS.values())
+    # Supabase already returns numbers for most columns; only convert the rest
+    coerce_numeric_columns(df)
     return df
 
 
-def run_scraper(
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the app's event loop, started on a background thread on first use.
+
+    One loop serves every session for the life of the server, so sessions
+    that end leave no thread behind. Script threads only submit work to it
+    and stay free to be stopped while a scrape is in flight.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="scraper-event-loop", daemon=True).start()
+    return loop
+
+
+def run_on_loop(loop: asyncio.AbstractEventLoop, coro, timeout: float | None = None):
+    """Run ``coro`` on the app's loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def _shutdown_browser(loop: asyncio.AbstractEventLoop, playwright: Playwright, browser: Browser) -> None:
+    if loop.is_closed():
+        return
+    try:
+        run_on_loop(loop, browser.close(), timeout=10)
+        run_on_loop(loop, playwright.stop(), timeout=10)
+    except Exception:
+        pass  # Interpreter is exiting; nothing left to clean up for
+
+
+def _browser_is_connected(handle: tuple[Playwright, Browser]) -> bool:
+    """Keep the shared browser while it is up; stop the driver of a dead one."""
+    playwright, browser = handle
+    if browser.is_connected():
+        return True
+    try:
+        run_on_loop(get_event_loop(), playwright.stop(), timeout=10)
+    except Exception:
+        pass
+    return False
+
+
+@st.cache_resource(show_spinner=False, validate=_browser_is_connected)
+def _browser_handle() -> tuple[Playwright, Browser]:
+    loop = get_event_loop()
+    playwright = run_on_loop(loop, async_playwright().start())
+    browser = run_on_loop(loop, launch_browser(playwright))
+    # Only the current browser needs closing at exit
+    atexit.unregister(_shutdown_browser)
+    atexit.register(_shutdown_browser, loop, playwright, browser)
+    return playwright, browser
+
+
+def get_browser() -> Browser:
+    """Return the app's Chromium, launching it only when not already running.
+
+    Launching a browser takes seconds; one browser shared by every session
+    means each scrape only pays for a new browser context, and the number
+    of Chromium processes does not grow with visitors. A browser that has
+    crashed or disconnected is replaced on the next call.
+    """
+    return _browser_handle()[1]
+
+
+SCRAPE_POLL_SECONDS = 0.5
+
+
+def wait_for_future(future: Future, started: float, on_poll=None):
+    """Show time elapsed since ``started`` until ``future`` finishes; return its result.
+
+    Each update lets Streamlit stop this run. ``on_poll`` is called on the
+    script thread at every update, so it may draw widgets.
+    """
+    elapsed = st.empty()
+    while not future.done():
+        elapsed.caption(f"Scraping... {time.monotonic() - started:.0f}s elapsed")
+        if on_poll is not None:
+            on_poll()
+        time.sleep(SCRAPE_POLL_SECONDS)
+    elapsed.empty()
+    return future.result()
+
+
+def run_cancellable(loop: asyncio.AbstractEventLoop, coro, on_poll=None):
+    """Run ``coro`` on the app's loop, showing elapsed time until it finishes.
+
+    If Streamlit stops this run first (Stop, or any widget change), the task
+    is cancelled instead of left running.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return wait_for_future(future, time.monotonic(), on_poll)
+    finally:
+        if not future.done():
+            future.cancel()
+
+
+def start_scraper(
+    loop: asyncio.AbstractEventLoop,
+    browser: Browser,
     category_slug: str,
     subcategory_slug: str,
     max_products: int,
     fast_mode: bool,
     rate_limit: int,
-    run_id: str,
-    storage_mode: str,
-) -> list[Product]:
-    """Run the scraper and return products."""
+    max_concurrency: int = 5,
+) -> Future:
+    """Start the scraper on ``loop`` with ``browser``.
+
+    The returned future resolves to ``(products, debug_info)``.
+    """
+    return asyncio.run_coroutine_threadsafe(
+        scrape_discover_page(
+            category_url=build_discover_url(category_slug, subcategory_slug),
+            category_slug=category_slug,
+            subcategory_slug=subcategory_slug,
+            max_products=max_products,
+            get_detailed_ratings=not fast_mode,
+            rate_limit_ms=rate_limit,
+            browser=browser,
+            max_concurrency=max_concurrency,
+        ),
+        loop,
+    )
 
-    url = build_discover_url(category_slug, subcategory_slug)
 
-    # Console debug: what is actually being passed to the scraper
-    print(f"\n>>> run_scraper() called with:")
-    print(f">>>   category_slug: '{category_slug}'")
-    print(f">>>   subcategory_slug: '{subcategory_slug}'")
-    print(f">>>   Built URL: {url}")
+SAVED_SEARCH_MAX_PRODUCTS = 100
+SAVED_SEARCH_RATE_LIMIT_MS = 500
+# Saved searches scraped at once by Check All; each also fetches its detail
+# pages concurrently, so keep this small
+SAVED_SEARCH_CONCURRENCY = 3
 
-    st.write(
-        f"Scraping with run_id={run_id} | category={category_slug} | subcategory={subcategory_slug or 'all'} | storage={storage_mode}"
-    )
 
-    # Run async scraper in sync context
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        products, _debug_info = loop.run_until_complete(
-            scrape_discover_page(
-                category_url=url,
-                category_slug=category_slug,
-                subcategory_slug=subcategory_slug,
-                max_products=max_products,
-                get_detailed_ratings=not fast_mode,
-                rate_limit_ms=rate_limit,
+async def _scrape_saved_searches(searches: list[SavedSearch], browser: Browser) -> list:
+    """Scrape saved searches concurrently; failures are returned in place of products."""
+    semaphore = asyncio.Semaphore(SAVED_SEARCH_CONCURRENCY)
+
+    async def scrape_one(search: SavedSearch) -> list[Product]:
+        async with semaphore:
+            products, _debug_info = await scrape_discover_page(
+                category_url=build_discover_url(search.category, search.subcategory or ""),
+                category_slug=search.category,
+                subcategory_slug=search.subcategory or "",
+                max_products=SAVED_SEARCH_MAX_PRODUCTS,
+                get_detailed_ratings=True,
+                rate_limit_ms=SAVED_SEARCH_RATE_LIMIT_MS,
+                browser=browser,
             )
-        )
-    finally:
-        loop.close()
+            return products
 
-    return products
+    return await asyncio.gather(*(scrape_one(search) for search in searches), return_exceptions=True)
 
 
-def to_dataframe(products: list[Product], scored: list[dict]) -> pd.DataFrame:
-    """Combine scraped products and scores into a dataframe for display."""
+SAVED_LISTS_TTL_SECONDS = 30
 
-    if not products or not scored:
-        return pd.DataFrame()
 
-    rows = []
-    for product, score in zip(products, scored):
-        payload = asdict(product)
-        payload.update(score)
-        rows.append(payload)
+@st.cache_data(ttl=SAVED_LISTS_TTL_SECONDS, show_spinner=False)
+def cached_saved_searches() -> list[SavedSearch]:
+    """Saved searches, read from the database at most once per TTL.
 
-    df = pd.DataFrame(rows)
-    for numeric_col in [
-        "price_usd",
-        "average_rating",
-        "total_reviews",
-        "sales_count",
-        "estimated_revenue",
-        "opportunity_score",
-    ]:
-        if numeric_col in df:
+    Every write in this app clears the cache, so only changes made by another
+    process or another app replica wait for the TTL.
+    """
+    return get_saved_searches()
+
+
+@st.cache_data(ttl=SAVED_LISTS_TTL_SECONDS, show_spinner=False)
+def cached_watchlist() -> list[WatchlistItem]:
+    """Watchlist items, read from the database at most once per TTL."""
+    return get_watchlist()
+
+
+def write_initial_snapshot(search_id: int, df: pd.DataFrame) -> None:
+    """Snapshot a newly saved search's results; runs on the write pool."""
+    save_snapshot(search_id, df.to_dict(orient="records"))
+    cached_saved_searches.clear()  # Last-checked time moved
+
+
+def wait_for_pending_snapshots() -> None:
+    """Block until this session's background snapshot writes have landed."""
+    for future in st.session_state.pop("pending_snapshots", ()):
+        try:
+            future.result()
+        except Exception as exc:
+            st.warning(f"Could not save a search snapshot: {exc}")
+
+
+def check_saved_searches(searches: list[SavedSearch]) -> list:
+    """Re-scrape saved searches and return the changes found across all of them."""
+    # Changes are found against the latest snapshot, so it must be written
+    wait_for_pending_snapshots()
+    loop = get_event_loop()
+    results = run_cancellable(loop, _scrape_saved_searches(searches, get_browser()))
+
+    changes = []
+    for search, products in zip(searches, results):
+        if isinstance(products, Exception):
+            st.warning(f"Could not check '{search.name}': {products}")
+            continue
+        scored_products = score_product_dicts([product_to_dict(p) for p in products])
+        changes.extend(check_for_updates(search.id, scored_products))
+    cached_saved_searches.clear()  # Last-checked times moved
+    return changes
+
+
+_product_values = attrgetter(*PRODUCT_FIELDS)
+NUMERIC_COLUMNS = (
+    "price_usd",
+    "average_rating",
+    "total_reviews",
+    "sales_count",
+    "estimated_revenue",
+    "opportunity_score",
+)
+# Text columns holding a handful of distinct values across a result set
+CATEGORICAL_COLUMNS = (
+    "creator_name",
+    "category",
+    "subcategory",
+    "currency",
+    "revenue_confidence",
+)
+
+
+def coerce_numeric_columns(df: pd.DataFrame) -> None:
+    """Coerce numeric columns in place, skipping those already numeric.
+
+    Columns that came in as real numbers keep their inferred dtype; only
+    object columns (all-None, or loaded from storage as text) are converted.
+    """
+    for numeric_col in NUMERIC_COLUMNS:
+        if numeric_col not in df:
+            continue
+        if not pd.api.types.is_numeric_dtype(df[numeric_col]):
             df[numeric_col] = pd.to_numeric(df[numeric_col], errors="coerce")
 
-    return df
 
+def categorize_repeated_columns(df: pd.DataFrame) -> None:
+    """Store repetitive text columns as categoricals, in place.
 
-# Create tabs for different features
-tab_scrape, tab_saved, tab_watchlist, tab_full_scrape = st.tabs(["Scrape", "Saved Searches", "Watchlist", "Full Scrape"])
+    Each distinct creator or category string is then held once instead of
+    once per row, which shrinks the frame kept in session state and the
+    Arrow tables sent to the browser.
+    """
+    for text_col in CATEGORICAL_COLUMNS:
+        if text_col in df and not isinstance(df[text_col].dtype, pd.CategoricalDtype):
+            df[text_col] = df[text_col].astype("category")
 
-with tab_scrape:
-    # Main scraping area
-    col1, col2 = st.columns([1, 4])
 
-    with col1:
-        scrape_button = st.button(
-            "Scrape",
-            type="primary",
-            use_container_width=True,
-        )
+def start_scrape(
+    category_slug: str,
+    subcategory_slug: str,
+    max_products: int,
+    fast_mode: bool,
+    rate_limit: int,
+    max_concurrency: int = 5,
+) -> Future:
+    """Start scraping a search on the app's background loop with its warm browser."""
+    return start_scraper(
+        get_event_loop(),
+        get_browser(),
+        category_slug=category_slug,
+        subcategory_slug=subcategory_slug,
+        max_products=max_products,
+        fast_mode=fast_mode,
+        rate_limit=rate_limit,
+        max_concurrency=max_concurrency,
+    )
 
-    if scrape_button:
-        # Clear all caches before scraping to ensure fresh data
-        st.cache_data.clear()
 
-        st.session_state.scraping = True
-        st.session_state.results = None
-        st.session_state.scored_results = None
+def score_and_store(path: Path, products: list[Product]) -> list[dict]:
+    """Score a finished scrape, keeping the scored rows for repeat searches.
 
-        # DEBUG: Show timestamp and exactly what we're about to scrape
-        scrape_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        st.warning(f"🕐 SCRAPE STARTED: {scrape_timestamp}")
+    The scored rows of each search are kept on disk (see scrape_cache) keyed
+    on the scrape inputs; the Scrape button serves a repeat search from there
+    while it is fresh, across sessions and restarts. Empty results are never
+    stored. ``discard_results`` forces a fresh scrape.
+    """
+    scored_products = score_product_dicts([product_to_dict(p) for p in products])
+    store_results(path, scored_products)
+    return scored_products
 
-        # Print to console for debugging
-        print(f"\n{'='*60}")
-        print(f"SCRAPE DEBUG - {scrape_timestamp}")
-        print(f"{'='*60}")
-        print(f"UI Selection:")
-        print(f"  - category_label (dropdown): '{category_label}'")
-        print(f"  - subcategory_label (dropdown): '{subcategory_label}'")
-        print(f"Resolved Values:")
-        print(f"  - category_slug: '{category_slug}'")
-        print(f"  - subcategory_slug: '{subcategory_slug}'")
-        print(f"{'='*60}\n")
 
-        st.info(f"**UI Selection:** Category='{category_label}', Subcategory='{subcategory_label}'")
+def to_dataframe(products: list[Product], scored: list[dict]) -> pd.DataFrame:
+    """Combine scraped products and scores into a dataframe for display."""
 
-        subcategory_text = f" / {subcategory_label}" if subcategory_slug else ""
-        run_id = run_store.start_run(
-            category=category_slug,
-            subcategory=subcategory_slug,
-            max_products=max_products,
-            fast_mode=fast_mode,
-            rate_limit_ms=rate_limit,
+    if not products or not scored:
+        return pd.DataFrame()
+
+    # Scored rows already carry every product field (score_product_dict
+    # extends the product dict), so they alone make the frame; product
+    # attributes only fill in fields a row lacks
+    count = min(len(products), len(scored))
+    df = pd.DataFrame.from_records(scored[:count], nrows=count)
+    missing = [name for name in PRODUCT_FIELDS if name not in df]
+    if missing:
+        product_df = pd.DataFrame.from_records(
+            map(_product_values, products[:count]),
+            columns=PRODUCT_FIELDS,
+            nrows=count,
         )
-        st.session_state.current_run_id = str(run_id)
-        st.session_state.current_category_slug = category_slug
-        st.session_state.current_subcategory_slug = subcategory_slug
+        df = pd.concat([product_df[missing], df], axis=1)
+    coerce_numeric_columns(df)
+    categorize_repeated_columns(df)
 
-        scrape_url = build_discover_url(category_slug, subcategory_slug)
+    return df
 
-        # Print exact URL to console
-        print(f">>> SCRAPING URL: {scrape_url}")
-        print(f">>> Passed to run_scraper: category_slug='{category_slug}', subcategory_slug='{subcategory_slug}'")
 
-        st.info(f"Run ID: {run_id} | Storage: {storage_label}")
-        st.code(f"🔗 EXACT URL BEING SCRAPED:\n{scrape_url}")
-        st.write(
-            f"Selected category: **{category_label}** | Selected subcategory: **{subcategory_label}** | Mode: {storage_mode}"
-        )
+def stored_results_frame(results_key: str) -> pd.DataFrame | None:
+    """Return the frame kept for ``results_key`` in session state, if any.
 
-        with st.spinner(
-            f"Scraping {category_label}{subcategory_text}... This may take a few minutes."
-        ):
-            try:
-                products = run_scraper(
-                    category_slug=category_slug,
-                    subcategory_slug=subcategory_slug,
-                    max_products=max_products,
-                    fast_mode=fast_mode,
-                    rate_limit=rate_limit,
-                    run_id=str(run_id),
-                    storage_mode=storage_mode,
-                )
-                st.session_state.results = products
+    Keeping the frame itself (rather than rows, or an st.cache_data entry that
+    is unpickled on every read) means a rerun reuses it as-is.
+    """
+    stored = st.session_state.results_frame
+    if stored is not None and stored[0] == results_key:
+        return stored[1]
+    return None
 
-                # Score all products
-                product_dicts = [asdict(p) for p in products]
-                scored_products = [score_product_dict(p) for p in product_dicts]
-                st.session_state.scored_results = scored_products
 
-                totals = run_store.record_snapshots(run_id, products, scored_products)
-                run_store.complete_run(run_id, totals={"total": len(products), **totals})
+def remember_results_frame(results_key: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Keep a non-empty result frame for later reruns and return it."""
+    if not df.empty:
+        st.session_state.results_frame = (results_key, df)
+    return df
 
-                first_urls = [p.product_url for p in products[:3]]
-                if first_urls:
-                    st.write("First scraped product URLs:")
-                    st.code("\n".join(first_urls))
 
-                complete_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"\n>>> SCRAPE COMPLETED: {complete_timestamp}")
-                print(f">>> Products scraped: {len(products)}")
-                if products:
-                    print(f">>> First product: {products[0].product_name}")
-                    print(f">>> First product URL: {products[0].product_url}")
+def _present(column: pd.Series) -> np.ndarray:
+    """Non-missing values of a numeric column as a float64 array."""
+    values = column.to_numpy(dtype="float64", na_value=np.nan)
+    return values[~np.isnan(values)]
 
-                st.success(f"✅ Scraped {len(products)} products at {complete_timestamp}")
-            except Exception as e:
-                st.error(f"Error: {e}")
-                run_store.complete_run(run_id, status="failed", error=str(e))
-                st.session_state.results = None
-                st.session_state.scored_results = None
 
-        st.session_state.scraping = False
+def _mean(column: pd.Series, default: float = np.nan) -> float:
+    values = _present(column)
+    return values.mean() if values.size else default
 
-    # Prefer freshly scraped results in memory; fall back to persisted snapshots
-    df = to_dataframe(st.session_state.results or [], st.session_state.scored_results or [])
 
-    if df.empty and st.session_state.current_run_id:
-        try:
-            df = load_run_results(
-                st.session_state.current_run_id,
-                st.session_state.current_category_slug or category_slug,
-                st.session_state.current_subcategory_slug or subcategory_slug,
-                run_store,
-            )
-            if not df.empty:
-                st.session_state.scored_results = df.to_dict(orient="records")
-        except Exception as exc:
-            st.error(f"Unable to load results for run {st.session_state.current_run_id}: {exc}")
+def summary_metrics(results_key: str, df: pd.DataFrame) -> tuple[int, float, float, float, float]:
+    """Return (count, avg price, avg rating, total sales, avg score) for a result set.
 
-    # Display results
-    if not df.empty:
-        scored_products = df.to_dict(orient="records")
+    Aggregated once per result set and kept in session state for later reruns.
+    """
+    cached = st.session_state.summary_metrics
+    if cached is not None and cached[0] == results_key:
+        return cached[1]
 
-        # Summary metrics
-        st.markdown("---")
-        col1, col2, col3, col4, col5 = st.columns(5)
+    metrics = (
+        len(df),
+        _mean(df["price_usd"]),
+        _mean(df["average_rating"], default=0),
+        _present(df["sales_count"]).sum(),
+        _mean(df["opportunity_score"]),
+    )
+    st.session_state.summary_metrics = (results_key, metrics)
+    return metrics
 
-        with col1:
-            st.metric("Products", len(df))
 
-        with col2:
-            avg_price = df["price_usd"].mean()
-            st.metric("Avg Price", f"${avg_price:.2f}")
+def ranked_results(results_key: str, df: pd.DataFrame) -> tuple[pd.DataFrame, pa.Table | pd.DataFrame]:
+    """Return a result set ranked by opportunity score, plus an Arrow copy for display.
 
-        with col3:
-            rated = df[df["average_rating"].notna()]
-            avg_rating = rated["average_rating"].mean() if len(rated) > 0 else 0
-            st.metric("Avg Rating", f"{avg_rating:.2f}")
+    Kept in session state like the summary metrics, so fragment reruns reuse
+    both; st.dataframe renders an Arrow table without converting it again.
+    """
+    cached = st.session_state.ranked_results
+    if cached is not None and cached[0] == results_key:
+        return cached[1]
 
-        with col4:
-            total_sales = df["sales_count"].sum()
-            st.metric("Total Sales", f"{total_sales:,.0f}" if pd.notna(total_sales) else "N/A")
+    ranked = df.sort_values("opportunity_score", ascending=False, kind="stable")
+    try:
+        table = pa.Table.from_pandas(ranked, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        table = ranked  # Mixed-type columns; let st.dataframe apply its own fallbacks
+    st.session_state.ranked_results = (results_key, (ranked, table))
+    return ranked, table
+
+
+@st.cache_data(show_spinner=False)
+def results_csv(results_key: str, _df: pd.DataFrame) -> bytes:
+    """Encode a result set as CSV once per ``results_key`` rather than every rerun.
+
+    Download buttons pass this as a callable, so it only runs on the first click.
+    """
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+# Built once at import; Streamlit copies column configs before using them.
+# The Top 10 table shares this mapping and its column_order hides the rest.
+RESULTS_COLUMN_CONFIG = {
+    "product_name": st.column_config.TextColumn("Product", width="large"),
+    "creator_name": st.column_config.TextColumn("Creator", width="medium"),
+    "opportunity_score": st.column_config.NumberColumn("Score", format="%.1f"),
+    "price_usd": st.column_config.NumberColumn("Price (USD)", format="$%.2f"),
+    "average_rating": st.column_config.NumberColumn("Rating", format="%.1f"),
+    "total_reviews": st.column_config.NumberColumn("Reviews"),
+    "sales_count": st.column_config.NumberColumn("Sales", format="%d"),
+    "estimated_revenue": st.column_config.NumberColumn("Est. Revenue", format="$%.0f"),
+}
+
+
+@st.fragment
+def render_results(df: pd.DataFrame, results_key: str) -> None:
+    """Render metrics, tables, export and save controls for a result set.
+
+    Running as a fragment means interacting with these widgets only reruns
+    this block, not the scrape controls and other tabs.
+    """
+    # Rank once; the top 10 and the full table are both views of this order
+    ranked, ranked_table = ranked_results(results_key, df)
+
+    # Summary metrics
+    st.markdown("---")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    product_count, avg_price, avg_rating, total_sales, avg_score = summary_metrics(results_key, df)
 
-        with col5:
-            avg_score = df["opportunity_score"].mean()
-            st.metric("Avg Score", f"{avg_score:.1f}")
+    with col1:
+        st.metric("Products", product_count)
 
-        st.markdown("---")
+    with col2:
+        st.metric("Avg Price", f"${avg_price:.2f}")
 
-        # Top 10 by Opportunity Score
-        st.subheader("Top 10 by Opportunity Score")
-
-        top_10 = get_top_scored_products(scored_products, n=10)
-        if top_10:
-            top_df = pd.DataFrame(top_10)
-            top_display_cols = [
-                "product_name",
-                "opportunity_score",
-                "price_usd",
-                "average_rating",
-                "total_reviews",
-                "sales_count",
-                "estimated_revenue",
-            ]
+    with col3:
+        st.metric("Avg Rating", f"{avg_rating:.2f}")
 
-            st.dataframe(
-                top_df[top_display_cols],
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "product_name": st.column_config.TextColumn("Product", width="large"),
-                    "opportunity_score": st.column_config.NumberColumn("Score", format="%.1f"),
-                    "price_usd": st.column_config.NumberColumn("Price (USD)", format="$%.2f"),
-                    "average_rating": st.column_config.NumberColumn("Rating", format="%.1f"),
-                    "total_reviews": st.column_config.NumberColumn("Reviews"),
-                    "sales_count": st.column_config.NumberColumn("Sales", format="%d"),
-                    "estimated_revenue": st.column_config.NumberColumn("Est. Revenue", format="$%.0f"),
-                },
-            )
+    with col4:
+        st.metric("Total Sales", f"{total_sales:,.0f}" if pd.notna(total_sales) else "N/A")
 
-            # Score breakdown for top product
-            with st.expander("View Score Breakdown for Top Product"):
-                if top_10:
-                    st.code(get_score_breakdown(top_10[0]))
+    with col5:
+        st.metric("Avg Score", f"{avg_score:.1f}")
 
-        st.markdown("---")
+    st.markdown("---")
 
-        # Full Results table
-        st.subheader("All Results")
+    # Top 10 by Opportunity Score
+    st.subheader("Top 10 by Opportunity Score")
 
-        # Select columns to display
-        display_cols = [
+    if not ranked.empty:
+        top_display_cols = [
             "product_name",
-            "creator_name",
             "opportunity_score",
             "price_usd",
             "average_rating",
@@ -483,141 +696,215 @@ with tab_scrape:
         ]
 
         st.dataframe(
-            df[display_cols].sort_values("opportunity_score", ascending=False),
+            ranked_table[:10],
             use_container_width=True,
             hide_index=True,
-            column_config={
-                "product_name": st.column_config.TextColumn("Product", width="large"),
-                "creator_name": st.column_config.TextColumn("Creator", width="medium"),
-                "opportunity_score": st.column_config.NumberColumn("Score", format="%.1f"),
-                "price_usd": st.column_config.NumberColumn("Price (USD)", format="$%.2f"),
-                "average_rating": st.column_config.NumberColumn("Rating", format="%.1f"),
-                "total_reviews": st.column_config.NumberColumn("Reviews"),
-                "sales_count": st.column_config.NumberColumn("Sales", format="%d"),
-                "estimated_revenue": st.column_config.NumberColumn("Est. Revenue", format="$%.0f"),
-            },
+            column_order=top_display_cols,
+            column_config=RESULTS_COLUMN_CONFIG,
         )
 
-        # Download button
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="Download CSV",
-            data=csv,
-            file_name=f"gumroad_{category_slug}{f'_{subcategory_slug}' if subcategory_slug else ''}.csv",
-            mime="text/csv",
-        )
+        # Score breakdown for top product
+        with st.expander("View Score Breakdown for Top Product"):
+            st.code(get_score_breakdown(ranked.iloc[0].to_dict()))
 
-        # Expandable full data view
-        with st.expander("View All Columns"):
-            st.dataframe(df, use_container_width=True, hide_index=True)
+    st.markdown("---")
 
-        # Save Search button
-        st.markdown("---")
-        st.subheader("Save This Search")
-
-        save_col1, save_col2 = st.columns([3, 1])
-        with save_col1:
-            search_name = st.text_input(
-                "Search Name",
-                value=f"{category_label} - {subcategory_label}" if subcategory_slug else category_label,
-                key="save_search_name",
+    # Full Results table
+    st.subheader("All Results")
+
+    # Select columns to display
+    display_cols = [
+        "product_name",
+        "creator_name",
+        "opportunity_score",
+        "price_usd",
+        "average_rating",
+        "total_reviews",
+        "sales_count",
+        "estimated_revenue",
+    ]
+
+    # One table for both views: the toggle only changes which columns show,
+    # so the frame is serialized once instead of again for a full-data expander
+    show_all_columns = st.toggle("Show all columns", key="results_show_all_columns")
+    st.dataframe(
+        ranked_table,
+        use_container_width=True,
+        hide_index=True,
+        column_order=None if show_all_columns else display_cols,
+        column_config=RESULTS_COLUMN_CONFIG,
+    )
+
+    # Download button
+    st.download_button(
+        label="Download CSV",
+        data=partial(results_csv, results_key, df),
+        file_name=f"gumroad_{category_slug}{f'_{subcategory_slug}' if subcategory_slug else ''}.csv",
+        mime="text/csv",
+    )
+
+    # Save Search button
+    st.markdown("---")
+    st.subheader("Save This Search")
+
+    save_col1, save_col2 = st.columns([3, 1])
+    with save_col1:
+        search_name = st.text_input(
+            "Search Name",
+            value=f"{category_label} - {subcategory_label}" if subcategory_slug else category_label,
+            key="save_search_name",
+        )
+    with save_col2:
+        if st.button("Save Search", use_container_width=True):
+            saved = create_saved_search(
+                name=search_name,
+                category=category_slug,
+                subcategory=subcategory_slug,
             )
-        with save_col2:
-            if st.button("Save Search", use_container_width=True):
-                saved = create_saved_search(
-                    name=search_name,
-                    category=category_slug,
-                    subcategory=subcategory_slug,
-                )
-                # Save initial snapshot
-                save_snapshot(saved.id, scored_products)
-                st.success(f"Saved search '{search_name}' with {len(scored_products)} products!")
+            # Write the initial snapshot in the background; checks wait for it
+            st.session_state.pending_snapshots = [
+                *st.session_state.get("pending_snapshots", ()),
+                get_write_pool().submit(write_initial_snapshot, saved.id, df),
+            ]
+            cached_saved_searches.clear()
+            st.toast(f"Saved search '{search_name}' with {len(df)} products!")
+            # Full rerun so the Saved Searches tab lists the new search
+            st.rerun()
+
+
+CHANGE_TABLE_HEADER = "| | Change | Product | Details | |\n|---|---|---|---|---|\n"
+
+
+def _table_cell(value) -> str:
+    # Escape pipes (cell breaks) and dollar signs (Streamlit reads $...$ as LaTeX)
+    return str(value).replace("|", "\\|").replace("$", "\\$").replace("\n", " ")
+
 
+def change_table_row(change) -> str:
+    """Format one detected change as a markdown table row."""
+    icon = CHANGE_ICONS.get(change.change_type, DEFAULT_CHANGE_ICON)
+    if change.change_type == 'new':
+        details = f"Price: {change.new_value}"
     else:
-        st.info("Select a category and click **Scrape** to get started.")
+        details = f"{change.old_value} → {change.new_value}"
+    return (
+        f"| {icon} | **{change_label(change.change_type)}** | {_table_cell(change.product_name)} "
+        f"| {_table_cell(details)} | [View Product]({change.product_url}) |"
+    )
 
 
-with tab_saved:
-    st.subheader("Saved Searches")
+def report_changes(changes: list) -> None:
+    """Keep detected changes for display and send the digest.
 
-    saved_searches = get_saved_searches()
+    Only the rendered table is kept: it is all later reruns need, and one
+    string is cheaper to hold than the change objects.
+    """
+    st.session_state.detected_changes_table = (
+        CHANGE_TABLE_HEADER + "\n".join(change_table_row(change) for change in changes) if changes else None
+    )
+
+    if changes:
+        st.success(f"Found {len(changes)} changes!")
+        # Send digest (prints to console)
+        send_digest(changes)
+    else:
+        st.info("No changes detected since last check.")
+
+
+SAVED_SEARCH_EDITOR_KEY = "saved_searches_editor"
+SAVED_SEARCH_COLUMN_CONFIG = {
+    "name": st.column_config.TextColumn("Search", width="large"),
+    "category": st.column_config.TextColumn("Category"),
+    "subcategory": st.column_config.TextColumn("Subcategory"),
+    "last_checked": st.column_config.TextColumn("Last Checked"),
+    "check": st.column_config.CheckboxColumn("Check Updates"),
+    "delete": st.column_config.CheckboxColumn("Delete"),
+}
+
+
+def apply_saved_search_actions(search_ids: list) -> None:
+    """Act on the Check/Delete boxes ticked in the saved-searches table.
+
+    Deletes happen here; checks are queued for the fragment body so their
+    spinner and results render in place. Bumping the editor version gives the
+    next render a fresh, unticked table.
+    """
+    editor_key = f"{SAVED_SEARCH_EDITOR_KEY}_{st.session_state.saved_searches_editor_version}"
+    edited_rows = st.session_state[editor_key]["edited_rows"]
+    delete_ids = {search_ids[row] for row, edits in edited_rows.items() if edits.get("delete")}
+    for search_id in delete_ids:
+        delete_saved_search(search_id)
+    if delete_ids:
+        cached_saved_searches.clear()
+    st.session_state.pending_saved_search_checks = [
+        search_ids[row]
+        for row, edits in edited_rows.items()
+        if edits.get("check") and search_ids[row] not in delete_ids
+    ]
+    st.session_state.saved_searches_editor_version += 1
+
+
+@st.fragment
+def render_saved_searches() -> None:
+    """Render saved searches and any changes found by Check Updates.
+
+    As a fragment, checking or deleting a search reruns only this list, not
+    the scrape results or the other tabs. The list is a single data editor;
+    ticking a row's Check or Delete box acts on it.
+    """
+    saved_searches = cached_saved_searches()
 
     if not saved_searches:
         st.info("No saved searches yet. Scrape some products and save a search to get started.")
     else:
-        for search in saved_searches:
-            with st.container():
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-
-                with col1:
-                    st.write(f"**{search.name}**")
-                    st.caption(f"Category: {search.category}" + (f" / {search.subcategory}" if search.subcategory else ""))
-
-                with col2:
-                    if search.last_checked_at:
-                        st.caption(f"Last checked: {search.last_checked_at[:16]}")
-                    else:
-                        st.caption("Never checked")
-
-                with col3:
-                    if st.button("Check Updates", key=f"check_{search.id}", use_container_width=True):
-                        with st.spinner("Checking for updates..."):
-                            # Run a new scrape
-                            products = run_scraper(
-                                category_slug=search.category,
-                                subcategory_slug=search.subcategory or "",
-                                max_products=100,
-                                fast_mode=False,
-                                rate_limit=500,
-                                run_id=f"saved-search-{search.id}",
-                            )
-                            product_dicts = [asdict(p) for p in products]
-                            scored_products = [score_product_dict(p) for p in product_dicts]
-
-                            # Check for changes
-                            changes = check_for_updates(search.id, scored_products)
-                            st.session_state.detected_changes = changes
-
-                            if changes:
-                                st.success(f"Found {len(changes)} changes!")
-                                # Send digest (prints to console)
-                                send_digest(changes)
-                            else:
-                                st.info("No changes detected since last check.")
-
-                with col4:
-                    if st.button("Delete", key=f"del_{search.id}", type="secondary"):
-                        delete_saved_search(search.id)
-                        st.rerun()
-
-                st.markdown("---")
+        pending_ids = set(st.session_state.pop("pending_saved_search_checks", None) or ())
+        if pending_ids:
+            with st.spinner("Checking for updates..."):
+                report_changes(check_saved_searches([s for s in saved_searches if s.id in pending_ids]))
+            saved_searches = cached_saved_searches()  # Refresh "Last Checked"
+
+        if st.button("Check All", key="check_all_saved_searches"):
+            with st.spinner(f"Checking {len(saved_searches)} saved searches..."):
+                report_changes(check_saved_searches(saved_searches))
+            saved_searches = cached_saved_searches()
+
+        saved_df = pd.DataFrame(
+            {
+                "name": [s.name for s in saved_searches],
+                "category": [s.category for s in saved_searches],
+                "subcategory": [s.subcategory or "" for s in saved_searches],
+                "last_checked": [s.last_checked_at[:16] if s.last_checked_at else "Never" for s in saved_searches],
+                "check": False,
+                "delete": False,
+            }
+        )
+        search_ids = [s.id for s in saved_searches]
+        st.data_editor(
+            saved_df,
+            key=f"{SAVED_SEARCH_EDITOR_KEY}_{st.session_state.saved_searches_editor_version}",
+            use_container_width=True,
+            hide_index=True,
+            disabled=["name", "category", "subcategory", "last_checked"],
+            column_config=SAVED_SEARCH_COLUMN_CONFIG,
+            on_change=apply_saved_search_actions,
+            args=(search_ids,),
+        )
 
         # Show detected changes if any
-        if st.session_state.detected_changes:
+        if st.session_state.detected_changes_table:
             st.subheader("Detected Changes")
-            changes = st.session_state.detected_changes
-
-            for change in changes:
-                icon = {
-                    'new': '🆕',
-                    'price_change': '💰',
-                    'rating_change': '⭐',
-                    'sales_change': '📈',
-                }.get(change.change_type, '🔔')
-
-                with st.container():
-                    if change.change_type == 'new':
-                        st.write(f"{icon} **New Product**: {change.product_name}")
-                        st.caption(f"Price: {change.new_value}")
-                    else:
-                        st.write(f"{icon} **{change.change_type.replace('_', ' ').title()}**: {change.product_name}")
-                        st.caption(f"{change.old_value} → {change.new_value}")
-                    st.caption(f"[View Product]({change.product_url})")
+            # One markdown table rather than several elements per change
+            st.markdown(st.session_state.detected_changes_table)
 
 
-with tab_watchlist:
-    st.subheader("Watchlist")
+def remove_watchlist_item(item_id: int) -> None:
+    remove_from_watchlist(item_id)
+    cached_watchlist.clear()
+
 
+@st.fragment
+def render_watchlist() -> None:
+    """Render the add form and watchlist items; adding or removing reruns only this block."""
     # Add to watchlist form
     with st.expander("Add to Watchlist"):
         add_col1, add_col2 = st.columns([2, 1])
@@ -633,8 +920,9 @@ with tab_watchlist:
                     name = watch_name or watch_url[:50]
                     result = add_to_watchlist(watch_type, watch_url, name)
                     if result:
+                        cached_watchlist.clear()
+                        # The list below renders after this, so it already includes the item
                         st.success(f"Added '{name}' to watchlist!")
-                        st.rerun()
                     else:
                         st.warning("Item already in watchlist.")
                 else:
@@ -643,7 +931,7 @@ with tab_watchlist:
     st.markdown("---")
 
     # Display watchlist
-    watchlist = get_watchlist()
+    watchlist = cached_watchlist()
 
     if not watchlist:
         st.info("Your watchlist is empty. Add products or categories to track them.")
@@ -659,66 +947,93 @@ with tab_watchlist:
                 st.markdown(f"[Open Link]({item.url})")
 
             with col3:
-                if st.button("Remove", key=f"rm_{item.id}", type="secondary"):
-                    remove_from_watchlist(item.id)
-                    st.rerun()
+                st.button(
+                    "Remove",
+                    key=f"rm_{item.id}",
+                    type="secondary",
+                    on_click=remove_watchlist_item,
+                    args=(item.id,),
+                )
 
-    # Data table
-    st.subheader("Results")
 
-    if st.session_state.scored_results:
-        df = pd.DataFrame(st.session_state.scored_results)
+def cancel_scrape() -> None:
+    """Cancel the in-flight scrape and mark its run cancelled.
 
-        # Select columns to display
-        display_cols = [
-            "product_name",
-            "creator_name",
-            "price_usd",
-            "average_rating",
-            "total_reviews",
-            "sales_count",
-            "estimated_revenue",
-        ]
+    Other reruns leave the scrape running for the next run to pick up; only
+    this button stops it.
+    """
+    job = st.session_state.pop("scrape_job", None)
+    if job is None:
+        return  # Finished before the click landed
+    job["future"].cancel()
+    run_store.complete_run(job["run_id"], status="cancelled", error="Cancelled by user")
+    st.session_state.scraping = False
+    st.session_state.current_run_id = None
+    st.session_state.scrape_cancelled = True
 
-        st.dataframe(
-            df[display_cols],
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "product_name": st.column_config.TextColumn("Product", width="large"),
-                "creator_name": st.column_config.TextColumn("Creator", width="medium"),
-                "price_usd": st.column_config.NumberColumn("Price (USD)", format="$%.2f"),
-                "average_rating": st.column_config.NumberColumn("Rating", format="%.1f ⭐"),
-                "total_reviews": st.column_config.NumberColumn("Reviews"),
-                "sales_count": st.column_config.NumberColumn("Sales", format="%d"),
-                "estimated_revenue": st.column_config.NumberColumn("Est. Revenue", format="$%.0f"),
-            },
-        )
 
-        # Download button
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name=f"gumroad_{category_slug}{f'_{subcategory_slug}' if subcategory_slug else ''}.csv",
-            mime="text/csv",
-        )
+WATCHLIST_COLUMN_CONFIG = {
+    "product_name": st.column_config.TextColumn("Product", width="large"),
+    "creator_name": st.column_config.TextColumn("Creator", width="medium"),
+    "price_usd": st.column_config.NumberColumn("Price (USD)", format="$%.2f"),
+    "average_rating": st.column_config.NumberColumn("Rating", format="%.1f ⭐"),
+    "total_reviews": st.column_config.NumberColumn("Reviews"),
+    "sales_count": st.column_config.NumberColumn("Sales", format="%d"),
+    "estimated_revenue": st.column_config.NumberColumn("Est. Revenue", format="$%.0f"),
+}
 
-        # Expandable full data view
-        with st.expander("View All Columns"):
-            st.dataframe(df, use_container_width=True, hide_index=True)
 
-        st.subheader("Analyze with CrewAI")
-        render_analysis_block(
-            df.to_dict(orient="records"),
-            dataset_id=f"scrape-{category_slug}-{subcategory_slug or 'all'}",
-            source_label="Current scrape run",
-        )
-    else:
-        st.info("Select a category and click **Scrape** to get started.")
+@st.fragment
+def render_watchlist_results(df: pd.DataFrame, results_key: str, scored_rows: list[dict]) -> None:
+    """Render the current results table, export and analysis under the watchlist.
 
+    As a fragment, toggling columns or running an analysis reruns only this
+    section.
+    """
+    # Select columns to display
+    display_cols = [
+        "product_name",
+        "creator_name",
+        "price_usd",
+        "average_rating",
+        "total_reviews",
+        "sales_count",
+        "estimated_revenue",
+    ]
 
-with tab_full_scrape:
+    show_all_columns = st.toggle("Show all columns", key="watchlist_show_all_columns")
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_order=None if show_all_columns else display_cols,
+        column_config=WATCHLIST_COLUMN_CONFIG,
+    )
+
+    # Download button
+    st.download_button(
+        label="📥 Download CSV",
+        data=partial(results_csv, results_key, df),
+        file_name=f"gumroad_{category_slug}{f'_{subcategory_slug}' if subcategory_slug else ''}.csv",
+        mime="text/csv",
+    )
+
+    st.subheader("Analyze with CrewAI")
+    # Analyse the scored rows directly rather than round-tripping them
+    # through the dataframe again
+    render_analysis_block(
+        scored_rows,
+        dataset_id=f"scrape-{category_slug}-{subcategory_slug or 'all'}",
+        source_label="Current scrape run",
+    )
+
+
+@st.fragment
+def render_full_scrape() -> None:
+    """Render the Full Scrape settings, start button and last result.
+
+    Changing a setting here reruns only this tab.
+    """
     st.subheader("Full Scrape - All Categories")
 
     st.warning(
@@ -774,7 +1089,14 @@ with tab_full_scrape:
         from categories import CATEGORY_TREE
         total_categories = len(CATEGORY_TREE)
 
-        def update_progress(snapshot: dict):
+        # The scrape reports progress from the loop thread, which cannot draw
+        # widgets; keep the latest snapshot and render it from this thread
+        latest_progress: dict = {}
+
+        def update_progress():
+            if not latest_progress:
+                return
+            snapshot = dict(latest_progress)
             completed = snapshot.get("completed", 0)
             planned_total = snapshot.get("planned_total", 1)
             progress = completed / planned_total if planned_total else 0
@@ -790,20 +1112,18 @@ with tab_full_scrape:
             )
 
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
             run_id = datetime.utcnow().strftime("streamlit_full_%Y%m%d_%H%M%S")
-            result = loop.run_until_complete(
+            result = run_cancellable(
+                get_event_loop(),
                 scrape_all_categories(
                     max_per_category=full_max_products,
                     rate_limit_ms=full_rate_limit,
                     fast_mode=full_fast_mode,
-                    progress_callback=update_progress,
+                    progress_callback=latest_progress.update,
                     run_id=run_id,
-                )
+                ),
+                on_poll=update_progress,
             )
-            loop.close()
 
             progress_bar.progress(1.0)
             status_text.write(f"**Completed!** {result['total_products']} products from {result['total_categories']} categories")
@@ -840,3 +1160,212 @@ with tab_full_scrape:
                 status_icon = "+" if cat["status"] == "success" else "x"
                 error_msg = f" - {cat.get('error', '')}" if cat["status"] == "error" else ""
                 st.text(f"[{status_icon}] {cat['category']}: {cat['products']} products{error_msg}")
+
+
+# Create tabs for different features
+tab_scrape, tab_saved, tab_watchlist, tab_full_scrape = st.tabs(["Scrape", "Saved Searches", "Watchlist", "Full Scrape"])
+
+with tab_scrape:
+    # Main scraping area
+    col1, col2 = st.columns([1, 4])
+
+    with col1:
+        scrape_button = st.button(
+            "Scrape",
+            type="primary",
+            use_container_width=True,
+        )
+
+    if st.session_state.pop("scrape_cancelled", False):
+        st.warning("Scrape cancelled.")
+    if scrape_button and st.session_state.scraping:
+        st.warning("A scrape is already running; cancel it to start another.")
+        scrape_button = False
+
+    scrape_path = cache_path(category_slug, subcategory_slug, max_products, fast_mode)
+    cached_results = None
+    if scrape_button:
+        if force_refresh:
+            # Drop recent results so this search is scraped again
+            discard_results(scrape_path)
+        else:
+            cached_results = load_results(scrape_path)
+
+    if cached_results is not None:
+        # A repeat of a recent search: show the stored results as they were,
+        # without recording them as a new run with fresh timestamps
+        products, scored_products = cached_results
+        scraped_at = pd.Timestamp(products[0].scraped_at).strftime("%Y-%m-%d %H:%M:%S")
+        st.session_state.results = products
+        st.session_state.scored_results = scored_products
+        st.session_state.current_run_id = None
+        st.session_state.cached_results_key = f"cache-{scrape_path.stem}-{scraped_at}"
+        st.session_state.current_category_slug = category_slug
+        st.session_state.current_subcategory_slug = subcategory_slug
+        st.info(
+            f"Showing {len(products)} products from the identical search scraped at {scraped_at} UTC; "
+            "it was not recorded as a new run. Tick **Force Refresh** to scrape again."
+        )
+    elif scrape_button:
+        st.session_state.scraping = True
+        st.session_state.cached_results_key = None
+        st.session_state.results = None
+        st.session_state.scored_results = None
+
+        subcategory_text = f" / {subcategory_label}" if subcategory_slug else ""
+        run_id = run_store.start_run(
+            category=category_slug,
+            subcategory=subcategory_slug,
+            max_products=max_products,
+            fast_mode=fast_mode,
+            rate_limit_ms=rate_limit,
+        )
+        st.session_state.current_run_id = str(run_id)
+        st.session_state.current_category_slug = category_slug
+        st.session_state.current_subcategory_slug = subcategory_slug
+
+        # What is about to be scraped, shown as one collapsed element rather
+        # than a stack of separate messages
+        debug_payload = {
+            "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "category_label": category_label,
+            "subcategory_label": subcategory_label,
+            "category_slug": category_slug,
+            "subcategory_slug": subcategory_slug or "all",
+            "url": build_discover_url(category_slug, subcategory_slug),
+            "run_id": str(run_id),
+            "storage": storage_label,
+        }
+
+        # Kept in session state rather than on this run's stack: any widget
+        # change reruns the script, and the scrape must outlive that run
+        st.session_state.scrape_job = {
+            "future": start_scrape(
+                category_slug=category_slug,
+                subcategory_slug=subcategory_slug,
+                max_products=max_products,
+                fast_mode=fast_mode,
+                rate_limit=rate_limit,
+                max_concurrency=max_concurrency,
+            ),
+            "started": time.monotonic(),
+            "run_id": run_id,
+            "path": scrape_path,
+            "spinner": f"Scraping {category_label}{subcategory_text}... This may take a few minutes.",
+            "debug_payload": debug_payload,
+        }
+
+    # Wait for the scrape in flight, whether started by this run or an earlier one
+    job = st.session_state.get("scrape_job")
+    if job is not None:
+        run_id = job["run_id"]
+        debug_payload = job["debug_payload"]
+        debug_slot = st.empty()
+
+        def show_debug_payload() -> None:
+            with debug_slot.expander("Scrape details", expanded=False):
+                st.json(debug_payload)
+
+        show_debug_payload()
+
+        cancel_slot = col2.empty()
+        cancel_slot.button("Cancel", on_click=cancel_scrape)
+
+        with st.spinner(job["spinner"]):
+            error = None
+            try:
+                products, _debug_info = wait_for_future(job["future"], job["started"])
+            except Exception as e:
+                error = e
+            # Finished: from here on the run is recorded without touching
+            # Streamlit, so a rerun cannot interrupt it half way
+            del st.session_state.scrape_job
+            st.session_state.scraping = False
+            if error is None:
+                try:
+                    scored_products = score_and_store(job["path"], products)
+                    totals = run_store.record_snapshots(run_id, products, scored_products)
+                    run_store.complete_run(run_id, totals={"total": len(products), **totals})
+                except Exception as e:
+                    error = e
+
+            if error is None:
+                st.session_state.results = products
+                st.session_state.scored_results = scored_products
+
+                complete_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                debug_payload["completed_at"] = complete_timestamp
+                debug_payload["products_scraped"] = len(products)
+                debug_payload["first_product_urls"] = [p.product_url for p in products[:3]]
+                show_debug_payload()
+
+                st.success(f"✅ Scraped {len(products)} products at {complete_timestamp}")
+            else:
+                run_store.complete_run(run_id, status="failed", error=str(error))
+                st.session_state.results = None
+                st.session_state.scored_results = None
+                st.error(f"Error: {error}")
+
+        cancel_slot.empty()
+
+    # Prefer freshly scraped results in memory; fall back to persisted snapshots
+    in_memory = bool(st.session_state.results and st.session_state.scored_results)
+    if in_memory:
+        results_key = st.session_state.cached_results_key or f"scrape-{st.session_state.current_run_id}"
+    else:
+        results_key = f"run-{st.session_state.current_run_id}"
+
+    df = stored_results_frame(results_key)
+    if df is None and in_memory:
+        df = remember_results_frame(
+            results_key,
+            to_dataframe(st.session_state.results, st.session_state.scored_results),
+        )
+    if df is None:
+        df = pd.DataFrame()
+
+    if df.empty and st.session_state.current_run_id:
+        try:
+            df = load_run_results(
+                st.session_state.current_run_id,
+                st.session_state.current_category_slug or category_slug,
+                st.session_state.current_subcategory_slug or subcategory_slug,
+                run_store,
+            )
+            if not df.empty:
+                st.session_state.scored_results = df.to_dict(orient="records")
+                remember_results_frame(results_key, df)
+        except Exception as exc:
+            st.error(f"Unable to load results for run {st.session_state.current_run_id}: {exc}")
+
+    # Display results
+    if not df.empty:
+        render_results(df, results_key)
+    else:
+        st.info("Select a category and click **Scrape** to get started.")
+
+# The Watchlist tab shows the same rows; reuse this frame rather than build another
+results_df = df
+
+
+with tab_saved:
+    st.subheader("Saved Searches")
+    render_saved_searches()
+
+
+with tab_watchlist:
+    st.subheader("Watchlist")
+
+    render_watchlist()
+
+    # Data table
+    st.subheader("Results")
+
+    if st.session_state.scored_results and not results_df.empty:
+        render_watchlist_results(results_df, results_key, st.session_state.scored_results)
+    else:
+        st.info("Select a category and click **Scrape** to get started.")
+
+
+with tab_full_scrape:
+    render_full_scrape()
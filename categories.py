@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from urllib.parse import urlencode
 
@@ -288,6 +289,15 @@ CATEGORY_TREE: Tuple[Category, ...] = (
 
 CATEGORY_BY_LABEL: Dict[str, Category] = {cat.label: cat for cat in CATEGORY_TREE}
 CATEGORY_BY_SLUG: Dict[str, Category] = {cat.slug: cat for cat in CATEGORY_TREE}
+CATEGORY_LABELS: Tuple[str, ...] = tuple(CATEGORY_BY_LABEL)
+
+# Subcategory selectbox options and label -> slug lookups, keyed by category label
+SUBCATEGORY_LABELS: Dict[str, Tuple[str, ...]] = {
+    cat.label: tuple(sub.label for sub in cat.subcategories) for cat in CATEGORY_TREE
+}
+SUBCATEGORY_SLUGS: Dict[str, Dict[str, str]] = {
+    cat.label: {sub.label: sub.slug for sub in cat.subcategories} for cat in CATEGORY_TREE
+}
 
 CATEGORY_SLUG_ALIASES: Dict[str, str] = {
     "programming-and-tech": "software-development",
@@ -344,7 +354,25 @@ def build_discover_url(
         3. subcategory.path_suffix - use as path segment
         4. subcategory_slug or subcategory.slug - traditional path-based routing
         5. category_slug only - fallback to category-only URL
+
+    Slug-only calls are memoized. Subcategory objects hold an unhashable
+    query_params dict, so URLs built from them are computed each time.
     """
+    if subcategory is None:
+        return _slug_discover_url(category_slug, subcategory_slug or None)
+    return _build_discover_url(category_slug, subcategory_slug, subcategory)
+
+
+@lru_cache(maxsize=256)
+def _slug_discover_url(category_slug: str, subcategory_slug: str | None) -> str:
+    return _build_discover_url(category_slug, subcategory_slug)
+
+
+def _build_discover_url(
+    category_slug: str,
+    subcategory_slug: str | None = None,
+    subcategory: Subcategory | None = None,
+) -> str:
     if not category_slug:
         return "https://gumroad.com/discover"
     
@@ -10,9 +10,11 @@ import re
 import json
 import os
 import random
+from contextlib import AsyncExitStack
 from urllib.parse import urlparse
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -26,12 +28,17 @@ from playwright.async_api import (
 from playwright_stealth import stealth_async
 from tqdm import tqdm
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx ships with supabase
+    httpx = None
+
 from categories import CATEGORY_BY_SLUG, CATEGORY_TREE, build_discover_url, category_url_map
 from models import estimate_revenue
 from utils.progress import ProgressTracker
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Data class for Gumroad product information."""
     product_name: str
@@ -59,6 +66,18 @@ class Product:
     scraped_at: datetime = field(default_factory=datetime.utcnow)
 
 
+PRODUCT_FIELDS = tuple(f.name for f in fields(Product))
+_product_values = attrgetter(*PRODUCT_FIELDS)
+
+
+def product_to_dict(product: Product) -> dict:
+    """Return the product's fields as a dict.
+
+    Product is flat, so this matches ``asdict()`` without its recursive copy.
+    """
+    return dict(zip(PRODUCT_FIELDS, _product_values(product)))
+
+
 # Currency conversion rates to USD (approximate)
 CURRENCY_TO_USD = {
     'USD': 1.0,
@@ -749,6 +768,180 @@ async def get_product_details(
     return details
 
 
+# Server-rendered props of the Discover React component (card data, no JS needed)
+DISCOVER_PROPS_PATTERN = re.compile(
+    r'<script[^>]*data-component-name="Discover"[^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+
+
+def parse_discover_props(html: str) -> tuple[list[dict], bool] | None:
+    """
+    Extract the product dicts embedded in a discover page's HTML.
+
+    Returns (products in page order, whether the page holds every result), or
+    None when the props are missing and the page must be rendered instead.
+    """
+    match = DISCOVER_PROPS_PATTERN.search(html)
+    if not match:
+        return None
+    try:
+        props = json.loads(match.group(1))
+    except ValueError:
+        return None
+
+    search_results = props.get('search_results') or {}
+    search_products = search_results.get('products') or []
+    complete = len(search_products) >= (search_results.get('total') or 0)
+    return [*(props.get('recommended_products') or []), *search_products], complete
+
+
+def product_from_discover_props(item: dict, category: str, subcategory: str) -> Product:
+    """Build a card-level Product (no detail page data) from discover props."""
+    currency = (item.get('currency_code') or 'usd').upper()
+    price_value = (item.get('price_cents') or 0) / 100
+    price_is_pwyw = bool(item.get('is_pay_what_you_want'))
+    if price_value:
+        amount = f"${price_value:g}" if currency == 'USD' else f"{price_value:g} {currency}"
+        original_price = f"{amount}+" if price_is_pwyw else amount
+    else:
+        original_price = "Free"
+    price_usd = round(price_value * CURRENCY_TO_USD.get(currency, 1.0), 2)
+
+    ratings = item.get('ratings') or {}
+    total_reviews = ratings.get('count') or 0
+    average_rating = ratings.get('average') if total_reviews else None
+
+    estimated_revenue, revenue_confidence = estimate_revenue(price_usd, None, price_is_pwyw, currency)
+    return Product(
+        product_name=item.get('name') or "Unknown",
+        creator_name=(item.get('seller') or {}).get('name') or "Unknown",
+        category=category,
+        subcategory=subcategory,
+        price_usd=price_usd,
+        original_price=original_price,
+        price_is_pwyw=price_is_pwyw,
+        currency=currency,
+        average_rating=average_rating,
+        total_reviews=total_reviews,
+        rating_1_star=0,
+        rating_2_star=0,
+        rating_3_star=0,
+        rating_4_star=0,
+        rating_5_star=0,
+        mixed_review_count=0,
+        mixed_review_percent=0.0,
+        sales_count=None,
+        estimated_revenue=estimated_revenue,
+        revenue_confidence=revenue_confidence,
+        product_url=item.get('url') or "",
+        description=item.get('description'),
+    )
+
+
+def _proxy_url(proxy_config: dict | None) -> str | None:
+    """Turn a Playwright proxy config back into a URL for HTTP clients."""
+    if not proxy_config:
+        return None
+    server = proxy_config["server"]
+    parsed = urlparse(server if "://" in server else f"http://{server}")
+    credentials = ""
+    if proxy_config.get("username") and proxy_config.get("password"):
+        credentials = f"{proxy_config['username']}:{proxy_config['password']}@"
+    return f"{parsed.scheme}://{credentials}{parsed.netloc.rsplit('@', 1)[-1]}"
+
+
+async def scrape_discover_http(
+    category_url: str,
+    category: str,
+    subcategory: str,
+    max_products: int,
+) -> list[Product] | None:
+    """
+    Scrape card-level products from the server-rendered discover HTML.
+
+    Returns None when the page cannot be used without a browser: httpx is
+    missing, the request fails, the props are absent, or more products are
+    needed than the first page holds (loading more requires scrolling).
+    """
+    if httpx is None:
+        return None
+
+    try:
+        async with httpx.AsyncClient(
+            headers={"User-Agent": get_random_user_agent(), "Accept-Language": "en-US"},
+            proxy=_proxy_url(proxy_from_env()),
+            follow_redirects=True,
+            timeout=30,
+        ) as client:
+            response = await client.get(category_url)
+    except httpx.HTTPError as e:
+        print(f"[DEBUG] HTTP discover fetch failed: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"[DEBUG] HTTP discover fetch status={response.status_code} url={category_url}")
+        return None
+
+    parsed = parse_discover_props(response.text)
+    if parsed is None:
+        return None
+    items, complete = parsed
+
+    products = []
+    seen_urls = set()
+    for item in items:
+        url = item.get('url')
+        if not is_valid_product_url(url) or url in seen_urls:
+            continue
+        seen_urls.add(url)
+        products.append(product_from_discover_props(item, category, subcategory))
+        if len(products) >= max_products:
+            return products
+
+    return products if complete else None
+
+
+async def launch_browser(p) -> Browser:
+    """Launch headless Chromium with the scraper's flags and optional proxy."""
+    proxy_config = proxy_from_env()
+    launch_options = {
+        "headless": True,
+        "args": ["--disable-gpu", "--no-sandbox"],
+    }
+    if proxy_config:
+        launch_options["proxy"] = proxy_config
+
+    browser = await p.chromium.launch(**launch_options)
+
+    proxy_server = _proxy_host_port(proxy_config["server"]) if proxy_config else None
+    print(f"[DEBUG] Proxy configured: {bool(proxy_config)}, server={proxy_server}")
+    return browser
+
+
+class RequestPacer:
+    """Space request starts at least ``interval_ms`` apart across concurrent tasks.
+
+    Each ``wait()`` reserves the next free start time, so several pages can be
+    loading at once while new requests still begin no faster than the
+    configured rate. A random jitter of up to half the interval is added to
+    every gap to avoid a detectable fixed cadence.
+    """
+
+    def __init__(self, interval_ms: int):
+        self.interval_ms = max(0, interval_ms)
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval_ms:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        jitter = random.randint(0, self.interval_ms // 2)
+        self._next_start = start + (self.interval_ms + jitter) / 1000
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
 async def scrape_discover_page(
     category_url: str,
     category_slug: str | None = None,
@@ -757,6 +950,9 @@ async def scrape_discover_page(
     get_detailed_ratings: bool = True,
     rate_limit_ms: int = 500,
     show_progress: bool = False,
+    browser: Browser | None = None,
+    max_concurrency: int = 5,
+    http_mode: bool = False,
 ) -> tuple[list[Product], dict | None]:
     """
     Scrape products from a Gumroad discover/category page.
@@ -765,7 +961,13 @@ async def scrape_discover_page(
         category_url: URL of the category page to scrape
         max_products: Maximum number of products to scrape
         get_detailed_ratings: Whether to visit each product page for rating breakdown
-        rate_limit_ms: Delay between product page requests in milliseconds
+        rate_limit_ms: Minimum gap between product page request starts in
+            milliseconds, shared by all concurrent detail pages
+        browser: Already-launched browser to reuse (see launch_browser); it is
+            left open. When omitted a browser is launched and closed per call.
+        max_concurrency: Maximum number of product detail pages open at once
+        http_mode: Without detailed ratings, try reading cards from the
+            server-rendered HTML first and only launch a browser if needed
 
     Returns:
         Tuple of (products list, debug_info dict)
@@ -792,21 +994,21 @@ async def scrape_discover_page(
             debug["status"] = status
         return debug
     
-    # Helper function to setup browser, context, and page with request interception
-    async def setup_browser_and_page(p):
-        proxy_config = proxy_from_env()
-        launch_options = {
-            "headless": True,
-            "args": ["--disable-gpu", "--no-sandbox"],
-        }
-        if proxy_config:
-            launch_options["proxy"] = proxy_config
-
-        browser = await p.chromium.launch(**launch_options)
-
-        proxy_server = _proxy_host_port(proxy_config["server"]) if proxy_config else None
-        print(f"[DEBUG] Proxy configured: {bool(proxy_config)}, server={proxy_server}")
+    if http_mode and not get_detailed_ratings:
+        main_category = _resolve_main_category()
+        http_products = await scrape_discover_http(
+            category_url,
+            main_category,
+            subcategory_slug or main_category,
+            max_products,
+        )
+        if http_products is not None:
+            print(f"HTTP mode: read {len(http_products)} products without a browser")
+            return http_products, None
+        print("HTTP mode: server-rendered page was not enough; falling back to browser")
 
+    # Helper function to setup a context and page with request interception
+    async def setup_context_and_page(browser: Browser):
         # Configure user agent rotation
         context_options = {
             'viewport': {'width': 1920, 'height': 1080},
@@ -852,11 +1054,77 @@ async def scrape_discover_page(
 
         await page.route("**/*", block_resources)
         
-        return browser, context, page
+        return context, page
     
-    # Inner function containing the main scraping logic
-    async def perform_scrape(p):
-        browser, context, page = await setup_browser_and_page(p)
+    detail_semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    detail_pacer = RequestPacer(rate_limit_ms)
+
+    async def fetch_details(context, card_info: dict) -> dict | None:
+        """Fetch the detail page for one card; None if it could not be parsed."""
+        if not get_detailed_ratings:
+            return {
+                'rating_1_star': 0,
+                'rating_2_star': 0,
+                'rating_3_star': 0,
+                'rating_4_star': 0,
+                'rating_5_star': 0,
+                'sales_count': None,
+            }
+
+        async with detail_semaphore:
+            # Pace page starts across all slots rather than sleeping per page
+            await detail_pacer.wait()
+
+            detail_page = await context.new_page()
+            try:
+                await stealth_async(detail_page)
+                return await get_product_details(
+                    detail_page,
+                    card_info['product_url'],
+                    total_reviews_hint=card_info['total_reviews'],
+                )
+            except Exception as e:
+                print(f"  Error parsing product card: {e}")
+                return None
+            finally:
+                await detail_page.close()
+
+    def build_product(card_info: dict, rating_breakdown: dict, main_category: str, selected_subcategory: str) -> Product:
+        total_reviews = card_info['total_reviews']
+        mixed_count, mixed_percent = compute_mixed_review_stats(
+            total_reviews,
+            rating_breakdown,
+        )
+
+        # Estimate revenue (conservative)
+        sales = rating_breakdown['sales_count']
+        estimated_revenue, revenue_confidence = estimate_revenue(
+            card_info['price_usd'],
+            sales,
+            card_info['price_is_pwyw'],
+            card_info['currency'],
+        )
+
+        return Product(
+            **card_info,
+            category=main_category,
+            subcategory=selected_subcategory,
+            rating_1_star=rating_breakdown['rating_1_star'],
+            rating_2_star=rating_breakdown['rating_2_star'],
+            rating_3_star=rating_breakdown['rating_3_star'],
+            rating_4_star=rating_breakdown['rating_4_star'],
+            rating_5_star=rating_breakdown['rating_5_star'],
+            mixed_review_count=mixed_count,
+            mixed_review_percent=mixed_percent,
+            sales_count=sales,
+            estimated_revenue=estimated_revenue,
+            revenue_confidence=revenue_confidence,
+            description=rating_breakdown.get('description'),
+        )
+
+    # Inner function containing the main scraping logic; the caller owns
+    # the context (and browser) and closes them once this returns.
+    async def perform_scrape(context, page):
         debug_info = None
 
         print(f"Navigating to {category_url}...")
@@ -864,8 +1132,6 @@ async def scrape_discover_page(
         await page.wait_for_timeout(random.randint(2000, 5000))
         if response is None:
             print(f"[DEBUG] goto status=<none> url={category_url} final={page.url}")
-            await context.close()
-            await browser.close()
             return [], {
                 "error": "goto_no_response",
                 "url": category_url,
@@ -878,14 +1144,10 @@ async def scrape_discover_page(
         if response is None:
             print("[WARN] invalid_route")
             artifact_info = await capture_invalid_route_artifacts(page, _resolve_main_category())
-            await context.close()
-            await browser.close()
             return [], _invalid_route_debug("goto_no_response")
 
         if response.status == 404:
             print("[WARN] invalid_route")
-            await context.close()
-            await browser.close()
             return [], _invalid_route_debug("http_404", response.status)
 
         # Check page content for "Page not found" indicators (Gumroad may return 200 with error template)
@@ -912,8 +1174,6 @@ async def scrape_discover_page(
             ):
                 print("[WARN] invalid_route")
                 artifact_info = await capture_invalid_route_artifacts(page, _resolve_main_category())
-                await context.close()
-                await browser.close()
                 return [], _invalid_route_debug("page_not_found_text")
         except Exception as e:
             print(f"[DEBUG] Could not check for 'Page not found' indicators: {e}")
@@ -963,14 +1223,14 @@ async def scrape_discover_page(
                 if debug_info.get("possible_captcha"):
                     print("🚨 Detected possible CAPTCHA/block - aborting this category")
                     progress.close()
-                    await browser.close()
                     return products, debug_info  # Return empty list with debug info
 
             current_card_count = len(product_cards)
             print(f"Found {current_card_count} product cards on page (scraped: {len(products)}/{max_products})...")
 
+            pending_cards = []
             for card in product_cards:
-                if len(products) >= max_products:
+                if len(products) + len(pending_cards) >= max_products:
                     break
 
                 try:
@@ -1094,85 +1354,42 @@ async def scrape_discover_page(
                     if average_rating is None and total_reviews == 0:
                         print(f"  No rating metadata found for {product_name[:40]} ({product_url[:50]}...)")
 
-                    # Initialize rating breakdown
-                    rating_breakdown = {
-                        'rating_1_star': 0,
-                        'rating_2_star': 0,
-                        'rating_3_star': 0,
-                        'rating_4_star': 0,
-                        'rating_5_star': 0,
-                        'sales_count': None,
-                    }
-
-                    # Get detailed info if requested
-                    if get_detailed_ratings and product_url:
-                        # Rate limiting - add random jitter to avoid detection
-                        jitter = random.randint(0, rate_limit_ms // 2)
-                        await asyncio.sleep((rate_limit_ms + jitter) / 1000)
-
-                        detail_page = await context.new_page()
-                        await stealth_async(detail_page)
-                        rating_breakdown = await get_product_details(
-                            detail_page,
-                            product_url,
-                            total_reviews_hint=total_reviews,
-                        )
-                        await detail_page.close()
-
-                    mixed_count, mixed_percent = compute_mixed_review_stats(
-                        total_reviews,
-                        rating_breakdown,
-                    )
-
-                    # Estimate revenue (conservative)
-                    sales = rating_breakdown['sales_count']
-                    estimated_revenue, revenue_confidence = estimate_revenue(
-                        price_usd,
-                        sales,
-                        price_is_pwyw,
-                        currency,
-                    )
-
-                    product = Product(
-                        product_name=product_name,
-                        creator_name=creator_name,
-                        category=main_category,
-                        subcategory=selected_subcategory,
-                        price_usd=price_usd,
-                        original_price=original_price,
-                        price_is_pwyw=price_is_pwyw,
-                        currency=currency,
-                        average_rating=average_rating,
-                        total_reviews=total_reviews,
-                        rating_1_star=rating_breakdown['rating_1_star'],
-                        rating_2_star=rating_breakdown['rating_2_star'],
-                        rating_3_star=rating_breakdown['rating_3_star'],
-                        rating_4_star=rating_breakdown['rating_4_star'],
-                        rating_5_star=rating_breakdown['rating_5_star'],
-                        mixed_review_count=mixed_count,
-                        mixed_review_percent=mixed_percent,
-                        sales_count=sales,
-                        estimated_revenue=estimated_revenue,
-                        revenue_confidence=revenue_confidence,
-                        product_url=product_url,
-                        description=rating_breakdown.get('description'),
-                    )
-                    products.append(product)
-                    progress.update(1)
-                    if show_progress:
-                        progress.set_postfix(
-                            {
-                                "last": product_name[:32],
-                                "detail": "yes" if get_detailed_ratings else "no",
-                            },
-                            refresh=False,
-                        )
-                    print(f"[{len(products)}/{max_products}] {product_name[:40]}... | ${price_usd} | Rating: {average_rating or 'N/A'} ({total_reviews} reviews)")
+                    # Detail pages are fetched concurrently once the batch is collected
+                    pending_cards.append({
+                        'product_name': product_name,
+                        'creator_name': creator_name,
+                        'price_usd': price_usd,
+                        'original_price': original_price,
+                        'price_is_pwyw': price_is_pwyw,
+                        'currency': currency,
+                        'average_rating': average_rating,
+                        'total_reviews': total_reviews,
+                        'product_url': product_url,
+                    })
 
                 except Exception as e:
                     print(f"  Error parsing product card: {e}")
                     continue
 
+            breakdowns = await asyncio.gather(
+                *(fetch_details(context, card_info) for card_info in pending_cards)
+            )
+            for card_info, rating_breakdown in zip(pending_cards, breakdowns):
+                if rating_breakdown is None:
+                    continue
+                product = build_product(card_info, rating_breakdown, main_category, selected_subcategory)
+                products.append(product)
+                progress.update(1)
+                if show_progress:
+                    progress.set_postfix(
+                        {
+                            "last": product.product_name[:32],
+                            "detail": "yes" if get_detailed_ratings else "no",
+                        },
+                        refresh=False,
+                    )
+                print(f"[{len(products)}/{max_products}] {product.product_name[:40]}... | ${product.price_usd} | Rating: {product.average_rating or 'N/A'} ({product.total_reviews} reviews)")
+
             # Check if we need more products
             if len(products) >= max_products:
                 break
@@ -1230,32 +1447,40 @@ async def scrape_discover_page(
                     )
                     break
 
-        try:
-            await browser.close()
-        except Exception:
-            pass  # Ignore errors during cleanup
-
         progress.close()
         
         return products, debug_info
     
     # Retry logic for page crash errors
     max_attempts = 2
-    
-    async with async_playwright() as p:
+
+    async with AsyncExitStack() as stack:
+        p = None if browser is not None else await stack.enter_async_context(async_playwright())
         for attempt in range(1, max_attempts + 1):
+            # A caller-supplied browser stays open; each attempt only gets a
+            # fresh context, which is far cheaper than relaunching Chromium.
+            attempt_browser = browser or await launch_browser(p)
+            context = None
             try:
-                products, debug_info = await perform_scrape(p)
+                context, page = await setup_context_and_page(attempt_browser)
+                products, debug_info = await perform_scrape(context, page)
                 return products, debug_info
             except Exception as e:
                 error_msg = str(e).lower()
                 if "page crash" in error_msg and attempt < max_attempts:
                     print(f"⚠️ Page crashed (attempt {attempt}/{max_attempts}), retrying...")
-                    # Cleanup is handled by perform_scrape closing the browser
                     continue
                 else:
                     # Either not a page crash error, or we're out of retries
                     raise
+            finally:
+                try:
+                    if context is not None:
+                        await context.close()
+                    if attempt_browser is not browser:
+                        await attempt_browser.close()
+                except Exception:
+                    pass  # Ignore errors during cleanup
 
 
 def save_to_csv(products: list[Product], filename: str):
@@ -1264,13 +1489,13 @@ def save_to_csv(products: list[Product], filename: str):
         print("No products to save.")
         return
 
-    fieldnames = list(asdict(products[0]).keys())
+    fieldnames = list(PRODUCT_FIELDS)
 
     with open(filename, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for product in products:
-            writer.writerow(asdict(product))
+            writer.writerow(product_to_dict(product))
 
     print(f"\nSaved {len(products)} products to {filename}")
 
@@ -1335,6 +1560,11 @@ Available categories:
         action='store_true',
         help='Fast mode: skip detailed product page scraping (no sales data)'
     )
+    parser.add_argument(
+        '--http-mode',
+        action='store_true',
+        help='With --fast, read cards from server-rendered HTML before launching a browser'
+    )
     parser.add_argument(
         '-o', '--output',
         type=str,
@@ -1392,6 +1622,7 @@ async def scrape_category(category: str, args) -> tuple[list[Product], dict | No
         get_detailed_ratings=not args.fast,
         rate_limit_ms=args.rate_limit,
         show_progress=not args.no_progress,
+        http_mode=args.http_mode,
     )
 
     return products, debug_info
@@ -102,7 +102,7 @@ st.download_button(
 
 st.subheader("Analyze run with CrewAI")
 render_analysis_block(
-    products_df.to_dict(orient="records"),
+    products_df,
     dataset_id=selected_run,
     source_label=f"Supabase run {selected_run}",
 )
@@ -7,9 +7,15 @@ like rating, reviews, price, and sales velocity.
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import heapq
 import math
 from typing import Iterable, Optional
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with pandas
+    np = None
+
 
 @dataclass
 class ScoredProduct:
@@ -45,6 +51,105 @@ WEIGHTS = {
 }
 
 
+@dataclass(frozen=True)
+class SignalBands:
+    """
+    Value bands for one signal, checked in order; the first match wins.
+
+    Each band is (low, high, signal, note) with inclusive bounds. Values in
+    no band, including NaN, get ``default``. Per-product scoring and the
+    numpy batch path both read these tables, so the cut-offs live only here.
+    """
+    bands: tuple[tuple[float, float, float, Optional[str]], ...]
+    default: tuple[float, Optional[str]]
+
+    def lookup(self, value: float) -> tuple[float, Optional[str]]:
+        for low, high, signal, note in self.bands:
+            if low <= value <= high:
+                return signal, note
+        return self.default
+
+    def select(self, values):
+        """Return (signals, notes) arrays for a numpy array of values."""
+        conditions = [(low <= values) & (values <= high) for low, high, _, _ in self.bands]
+        signals = np.select(conditions, [band[2] for band in self.bands], self.default[0])
+        notes = np.select(conditions, [band[3] or "" for band in self.bands], self.default[1] or "")
+        return signals, notes
+
+
+# Rating: 4.3+ is excellent, 4.0+ is good, below 3.5 is poor
+RATING_BANDS = SignalBands(
+    bands=(
+        (4.7, math.inf, 1.0, "excellent rating (4.7+)"),
+        (4.3, math.inf, 0.85, "great rating (4.3+)"),
+        (4.0, math.inf, 0.7, "good rating (4.0+)"),
+        (3.5, math.inf, 0.5, "average rating"),
+    ),
+    default=(0.2, "low rating"),
+)
+
+REVIEW_COUNT_BANDS = SignalBands(
+    bands=(
+        (100, math.inf, 1.0, "100+ reviews"),
+        (50, math.inf, 0.85, "50+ reviews"),
+        (20, math.inf, 0.7, "20+ reviews"),
+        (10, math.inf, 0.5, "10+ reviews"),
+        (5, math.inf, 0.35, "few reviews"),
+    ),
+    default=(0.2, "minimal reviews"),
+)
+
+# Mixed review penalty (2-4 star reviews indicate quality issues)
+# Lower mixed% is better - means mostly 5-star or clear negative feedback
+MIXED_REVIEW_BANDS = SignalBands(
+    bands=(
+        (-math.inf, 15, 1.0, None),
+        (-math.inf, 25, 0.8, None),
+        (-math.inf, 40, 0.6, None),
+    ),
+    default=(0.4, "high mixed reviews"),
+)
+
+# Sweet spot: $10-$79; below it is a volume play, above it premium territory
+PRICE_BANDS = SignalBands(
+    bands=(
+        (0, 0, 0.3, "free product"),
+        (15, 49, 1.0, "ideal price range ($15-$49)"),
+        (10, 79, 0.85, "good price range ($10-$79)"),
+        (5, 10, 0.6, "low price point"),
+        (-math.inf, 10, 0.4, "very low price"),
+        (-math.inf, 149, 0.7, "premium price ($80-$149)"),
+        (-math.inf, 299, 0.5, "high price ($150-$299)"),
+    ),
+    default=(0.35, "very high price ($300+)"),
+)
+
+SALES_BANDS = SignalBands(
+    bands=(
+        (10000, math.inf, 1.0, "viral (10K+ sales)"),
+        (5000, math.inf, 0.9, "bestseller (5K+ sales)"),
+        (1000, math.inf, 0.8, "strong sales (1K+)"),
+        (500, math.inf, 0.7, "good sales (500+)"),
+        (100, math.inf, 0.55, "moderate sales (100+)"),
+        (50, math.inf, 0.4, "some sales (50+)"),
+        (10, math.inf, 0.3, "early traction"),
+    ),
+    default=(0.2, "minimal sales"),
+)
+
+REVENUE_BANDS = SignalBands(
+    bands=(
+        (100000, math.inf, 1.0, "top earner ($100K+)"),
+        (50000, math.inf, 0.9, "high earner ($50K+)"),
+        (20000, math.inf, 0.8, "strong revenue ($20K+)"),
+        (10000, math.inf, 0.7, "good revenue ($10K+)"),
+        (5000, math.inf, 0.6, "moderate revenue ($5K+)"),
+        (1000, math.inf, 0.45, "some revenue ($1K+)"),
+    ),
+    default=(0.3, "low revenue"),
+)
+
+
 def compute_rating_signal(
     average_rating: Optional[float],
     total_reviews: int,
@@ -59,24 +164,7 @@ def compute_rating_signal(
     if total_reviews == 0:
         return 0.3, "no reviews"
 
-    # Rating score: 4.3+ is excellent, 4.0+ is good, below 3.5 is poor
-    if average_rating >= 4.7:
-        score = 1.0
-        note = "excellent rating (4.7+)"
-    elif average_rating >= 4.3:
-        score = 0.85
-        note = "great rating (4.3+)"
-    elif average_rating >= 4.0:
-        score = 0.7
-        note = "good rating (4.0+)"
-    elif average_rating >= 3.5:
-        score = 0.5
-        note = "average rating"
-    else:
-        score = 0.2
-        note = "low rating"
-
-    return score, note
+    return RATING_BANDS.lookup(average_rating)
 
 
 def compute_review_health_signal(
@@ -87,43 +175,16 @@ def compute_review_health_signal(
     Compute review health signal (0-1).
     Favors products with 20+ reviews and low mixed review percentage.
     """
-    notes = []
-
-    # Review count factor
-    if total_reviews >= 100:
-        count_score = 1.0
-        notes.append("100+ reviews")
-    elif total_reviews >= 50:
-        count_score = 0.85
-        notes.append("50+ reviews")
-    elif total_reviews >= 20:
-        count_score = 0.7
-        notes.append("20+ reviews")
-    elif total_reviews >= 10:
-        count_score = 0.5
-        notes.append("10+ reviews")
-    elif total_reviews >= 5:
-        count_score = 0.35
-        notes.append("few reviews")
-    else:
-        count_score = 0.2
-        notes.append("minimal reviews")
+    count_score, count_note = REVIEW_COUNT_BANDS.lookup(total_reviews)
+    notes = [count_note]
 
     if mixed_review_percent is None:
         notes.append("mixed reviews unavailable")
         return count_score, ", ".join(notes)
 
-    # Mixed review penalty (2-4 star reviews indicate quality issues)
-    # Lower mixed% is better - means mostly 5-star or clear negative feedback
-    if mixed_review_percent <= 15:
-        mixed_score = 1.0
-    elif mixed_review_percent <= 25:
-        mixed_score = 0.8
-    elif mixed_review_percent <= 40:
-        mixed_score = 0.6
-    else:
-        mixed_score = 0.4
-        notes.append("high mixed reviews")
+    mixed_score, mixed_note = MIXED_REVIEW_BANDS.lookup(mixed_review_percent)
+    if mixed_note:
+        notes.append(mixed_note)
 
     # Combine scores
     final_score = (count_score * 0.7) + (mixed_score * 0.3)
@@ -136,28 +197,7 @@ def compute_price_signal(price_usd: float) -> tuple[float, str]:
     Favors moderate prices ($10-$79) - the sweet spot for impulse buys
     with decent margins.
     """
-    if price_usd == 0:
-        return 0.3, "free product"
-
-    # Sweet spot: $10-$79
-    if 10 <= price_usd <= 79:
-        if 15 <= price_usd <= 49:
-            return 1.0, "ideal price range ($15-$49)"
-        return 0.85, "good price range ($10-$79)"
-
-    # Below sweet spot - potential volume play
-    if price_usd < 10:
-        if price_usd >= 5:
-            return 0.6, "low price point"
-        return 0.4, "very low price"
-
-    # Above sweet spot - premium territory
-    if price_usd <= 149:
-        return 0.7, "premium price ($80-$149)"
-    if price_usd <= 299:
-        return 0.5, "high price ($150-$299)"
-
-    return 0.35, "very high price ($300+)"
+    return PRICE_BANDS.lookup(price_usd)
 
 
 def compute_sales_velocity_signal(
@@ -170,22 +210,7 @@ def compute_sales_velocity_signal(
     if sales_count is None:
         return 0.3, "no sales data"
 
-    if sales_count >= 10000:
-        return 1.0, "viral (10K+ sales)"
-    if sales_count >= 5000:
-        return 0.9, "bestseller (5K+ sales)"
-    if sales_count >= 1000:
-        return 0.8, "strong sales (1K+)"
-    if sales_count >= 500:
-        return 0.7, "good sales (500+)"
-    if sales_count >= 100:
-        return 0.55, "moderate sales (100+)"
-    if sales_count >= 50:
-        return 0.4, "some sales (50+)"
-    if sales_count >= 10:
-        return 0.3, "early traction"
-
-    return 0.2, "minimal sales"
+    return SALES_BANDS.lookup(sales_count)
 
 
 def compute_revenue_signal(
@@ -198,20 +223,7 @@ def compute_revenue_signal(
     if estimated_revenue is None:
         return 0.3, "no revenue data"
 
-    if estimated_revenue >= 100000:
-        return 1.0, "top earner ($100K+)"
-    if estimated_revenue >= 50000:
-        return 0.9, "high earner ($50K+)"
-    if estimated_revenue >= 20000:
-        return 0.8, "strong revenue ($20K+)"
-    if estimated_revenue >= 10000:
-        return 0.7, "good revenue ($10K+)"
-    if estimated_revenue >= 5000:
-        return 0.6, "moderate revenue ($5K+)"
-    if estimated_revenue >= 1000:
-        return 0.45, "some revenue ($1K+)"
-
-    return 0.3, "low revenue"
+    return REVENUE_BANDS.lookup(estimated_revenue)
 
 
 def score_product(
@@ -306,6 +318,116 @@ def score_product_dict(product: dict) -> dict:
     }
 
 
+# Below this many products scoring row by row beats building numpy arrays
+VECTORIZE_MIN_ROWS = 500
+
+
+def _float_column(products: list[dict], key: str, default):
+    """Return (values with None as NaN, None mask) for one field across products."""
+    values = [p.get(key, default) for p in products]
+    missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    array = np.array([math.nan if v is None else v for v in values], dtype=float)
+    return array, missing
+
+
+def _score_product_dicts_vectorized(products: list[dict]) -> Optional[list[dict]]:
+    """
+    numpy version of score_product_dict over a batch.
+
+    The signals come from the same band tables as the scalar functions (NaN
+    falls through every band in both), and the final rounding stays in
+    Python, so results are identical. Returns None when a row would make the
+    scalar path raise (missing price or review count, non-numeric values) so
+    that path can report it.
+    """
+    try:
+        rating, no_rating = _float_column(products, 'average_rating', None)
+        reviews, no_reviews = _float_column(products, 'total_reviews', 0)
+        mixed, no_mixed = _float_column(products, 'mixed_review_percent', 0)
+        price, no_price = _float_column(products, 'price_usd', 0)
+        sales, no_sales = _float_column(products, 'sales_count', None)
+        revenue, no_revenue = _float_column(products, 'estimated_revenue', None)
+    except (TypeError, ValueError):
+        return None
+    if no_reviews.any() or no_price.any():
+        return None
+
+    rating_signal, rating_note = RATING_BANDS.select(rating)
+    rating_signal = np.where(no_rating | (reviews == 0), 0.3, rating_signal)
+    rating_note = np.where(no_rating, "no rating", np.where(reviews == 0, "no reviews", rating_note))
+
+    count_score, count_note = REVIEW_COUNT_BANDS.select(reviews)
+    mixed_score, mixed_note = MIXED_REVIEW_BANDS.select(mixed)
+    review_signal = np.where(no_mixed, count_score, (count_score * 0.7) + (mixed_score * 0.3))
+    mixed_note = np.where(no_mixed, "mixed reviews unavailable", mixed_note)
+
+    price_signal, price_note = PRICE_BANDS.select(price)
+
+    sales_signal, sales_note = SALES_BANDS.select(sales)
+    sales_signal = np.where(no_sales, 0.3, sales_signal)
+    sales_note = np.where(no_sales, "no sales data", sales_note)
+
+    revenue_signal, revenue_note = REVENUE_BANDS.select(revenue)
+    revenue_signal = np.where(no_revenue, 0.3, revenue_signal)
+    revenue_note = np.where(no_revenue, "no revenue data", revenue_note)
+
+    raw_score = (
+        rating_signal * WEIGHTS['rating'] +
+        review_signal * WEIGHTS['review_health'] +
+        price_signal * WEIGHTS['price'] +
+        sales_signal * WEIGHTS['sales_velocity'] +
+        revenue_signal * WEIGHTS['revenue']
+    )
+
+    rows = zip(
+        products,
+        raw_score.tolist(),
+        rating_signal.tolist(),
+        review_signal.tolist(),
+        price_signal.tolist(),
+        sales_signal.tolist(),
+        revenue_signal.tolist(),
+        rating_note.tolist(),
+        count_note.tolist(),
+        mixed_note.tolist(),
+        price_note.tolist(),
+        sales_note.tolist(),
+        revenue_note.tolist(),
+    )
+    scored = []
+    for (product, raw, rating_s, review_s, price_s, sales_s, revenue_s,
+         rating_n, count_n, mixed_n, price_n, sales_n, revenue_n) in rows:
+        review_n = f"{count_n}, {mixed_n}" if mixed_n else count_n
+        scored.append({
+            **product,
+            'opportunity_score': round(raw * 100, 1),
+            'score_notes': (
+                f"Rating: {rating_n}; Reviews: {review_n}; Price: {price_n}; "
+                f"Sales: {sales_n}; Revenue: {revenue_n}"
+            ),
+            'rating_signal': round(rating_s, 2),
+            'review_health_signal': round(review_s, 2),
+            'price_signal': round(price_s, 2),
+            'sales_velocity_signal': round(sales_s, 2),
+            'revenue_signal': round(revenue_s, 2),
+        })
+    return scored
+
+
+def score_product_dicts(products: list[dict]) -> list[dict]:
+    """
+    Score a batch of product dicts.
+
+    Same result as ``[score_product_dict(p) for p in products]``; large
+    batches compute the signals as numpy arrays when numpy is available.
+    """
+    if np is not None and len(products) >= VECTORIZE_MIN_ROWS:
+        scored = _score_product_dicts_vectorized(products)
+        if scored is not None:
+            return scored
+    return [score_product_dict(p) for p in products]
+
+
 def get_top_scored_products(
     products: list[dict],
     n: int = 10,
@@ -358,9 +480,9 @@ def get_top_scored_products(
             continue
         filtered.append(p)
 
-    # Sort by score and return top N
-    filtered.sort(key=lambda x: x['opportunity_score'], reverse=True)
-    return filtered[:n]
+    # Top N by score; nlargest keeps an n-sized heap instead of sorting
+    # everything, and ties keep input order just like a stable sort
+    return heapq.nlargest(n, filtered, key=lambda x: x['opportunity_score'])
 
 
 def get_score_breakdown(scored_product: dict) -> str:
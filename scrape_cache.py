@@ -0,0 +1,87 @@
+"""On-disk cache of scored scrape results, stored as one Parquet file per search.
+
+Gumroad listings change slowly, so a search repeated within ``MAX_AGE_SECONDS``
+(including after an app restart) can be served from disk instead of
+re-scraping. Without pyarrow the cache is disabled and every lookup misses.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from gumroad_scraper import Product
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    pa = None
+    pq = None
+
+CACHE_DIR = Path.home() / ".gumroad_scraper" / "cache"
+MAX_AGE_SECONDS = 3600
+
+_PRODUCT_FIELDS = tuple(f.name for f in fields(Product))
+
+
+def cache_path(
+    category_slug: str,
+    subcategory_slug: str,
+    max_products: int,
+    fast_mode: bool,
+    cache_dir: Path = CACHE_DIR,
+) -> Path:
+    """Return the Parquet file holding results for one search."""
+    key = repr((category_slug, subcategory_slug or "", int(max_products), bool(fast_mode)))
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir / f"{digest}.parquet"
+
+
+def load_results(path: Path, max_age: float = MAX_AGE_SECONDS) -> Optional[Tuple[List[Product], List[dict]]]:
+    """Return ``(products, scored_rows)`` from ``path`` if it is fresh, else None."""
+    if pq is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        scored = pq.read_table(path).to_pylist()
+        products = [Product(**{name: row.get(name) for name in _PRODUCT_FIELDS}) for row in scored]
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        print(f"Ignoring unreadable scrape cache {path}: {exc}")
+        return None
+    return products, scored
+
+
+def store_results(path: Path, scored: List[dict]) -> None:
+    """Write scored rows (product fields plus scores) to ``path``.
+
+    Written to a temporary file first so a concurrent reader never sees a
+    partial file. Rows pyarrow cannot type are simply not cached.
+    """
+    if pa is None or not scored:
+        return
+    tmp_path = path.with_suffix(".parquet.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.Table.from_pylist(scored), tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        print(f"Could not write scrape cache {path}: {exc}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def discard_results(path: Path) -> None:
+    """Remove a cached search, if present."""
+    path.unlink(missing_ok=True)
+
+
+def clear_results(cache_dir: Path = CACHE_DIR) -> None:
+    """Remove every cached search."""
+    for path in cache_dir.glob("*.parquet"):
+        path.unlink(missing_ok=True)
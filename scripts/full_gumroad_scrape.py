@@ -11,14 +11,14 @@ import random
 import urllib.request
 import urllib.error
 import json
-from dataclasses import asdict
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 
 from categories import CATEGORY_TREE, build_discover_url, should_skip_subcategory
-from gumroad_scraper import Product, scrape_discover_page, save_to_csv
-from opportunity_scoring import score_product_dict
+from gumroad_scraper import Product, product_to_dict, scrape_discover_page, save_to_csv
+from opportunity_scoring import score_product_dicts
 from supabase_utils import SupabasePersistence, SupabaseRunStore, get_supabase_client
 from utils.progress import ProgressTracker
 
@@ -123,9 +123,7 @@ async def _wait_with_jitter(seconds: int, label: str) -> None:
 def _merge_product(existing: Product | None, incoming: Product) -> Product:
     if existing is None or existing.subcategory or not incoming.subcategory:
         return existing or incoming
-    data = asdict(existing)
-    data["subcategory"] = incoming.subcategory
-    return Product(**data)
+    return replace(existing, subcategory=incoming.subcategory)
 
 
 async def _scrape_with_retry(
@@ -190,6 +188,21 @@ async def _scrape_with_retry(
     return [], None
 
 
+def _score_and_store(client, run_store: SupabaseRunStore, run_id, category_slug: str, products: list[Product]) -> None:
+    """Score one category's products and save them to Supabase.
+
+    Every step here is blocking (scoring is CPU, the rest are synchronous
+    Supabase requests), so callers run it with ``asyncio.to_thread``.
+    """
+    scored_products = score_product_dicts([product_to_dict(p) for p in products])
+
+    persistence = SupabasePersistence(client)
+    upsert_result = persistence.upsert_products(run_id, products)
+    print(f"Upserted products for {category_slug}: {upsert_result}")
+    totals = run_store.record_snapshots(run_id, products, scored_products)
+    run_store.complete_run(run_id, totals={"total": len(products), **totals})
+
+
 async def scrape_all_categories(
     max_per_category: int = 100,
     rate_limit_ms: int = 500,
@@ -229,8 +242,10 @@ async def scrape_all_categories(
         category_slug = category.slug
 
         try:
-            # Start a run for this category
-            run_id = run_store.start_run(
+            # Start a run for this category (Supabase calls block, so they
+            # run on a worker thread and leave the event loop free)
+            run_id = await asyncio.to_thread(
+                run_store.start_run,
                 category=category_slug,
                 subcategory="",
                 max_products=max_per_category,
@@ -251,16 +266,7 @@ async def scrape_all_categories(
             if debug_info and debug_info.get("invalid_route"):
                 print(f"[WARN] Invalid route for {url}: {debug_info}")
 
-            # Score products
-            product_dicts = [asdict(p) for p in products]
-            scored_products = [score_product_dict(p) for p in product_dicts]
-
-            # Save to Supabase
-            persistence = SupabasePersistence(client)
-            upsert_result = persistence.upsert_products(run_id, products)
-            print(f"Upserted products for {category_slug}: {upsert_result}")
-            totals = run_store.record_snapshots(run_id, products, scored_products)
-            run_store.complete_run(run_id, totals={"total": len(products), **totals})
+            await asyncio.to_thread(_score_and_store, client, run_store, run_id, category_slug, products)
 
             total_products += len(products)
             category_results.append({
@@ -445,7 +451,7 @@ async def run() -> None:
     )
     upsert_totals = persistence.upsert_products(run_id, products)
     print(f"Supabase upsert results: {upsert_totals}")
-    scored_products = [score_product_dict(asdict(product)) for product in products]
+    scored_products = score_product_dicts([product_to_dict(product) for product in products])
     snapshot_totals = run_store.record_snapshots(run_id, products, scored_products)
     run_store.complete_run(run_id, totals={"total": len(products), **snapshot_totals})
 
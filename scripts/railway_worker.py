@@ -5,13 +5,12 @@ import argparse
 import asyncio
 import os
 import sys
-from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 
 from categories import CATEGORY_TREE, build_discover_url, should_skip_subcategory
-from gumroad_scraper import Product, save_to_csv
-from opportunity_scoring import score_product_dict
+from gumroad_scraper import Product, product_to_dict, save_to_csv
+from opportunity_scoring import score_product_dicts
 from supabase_utils import SupabasePersistence, SupabaseRunStore, get_supabase_client
 from utils.progress import ProgressTracker, write_status_file
 
@@ -219,7 +218,7 @@ async def run() -> None:
         rate_limit_ms=0,
     )
     persistence.upsert_products(run_id, products)
-    scored_products = [score_product_dict(asdict(product)) for product in products]
+    scored_products = score_product_dicts([product_to_dict(product) for product in products])
     snapshot_totals = run_store.record_snapshots(run_id, products, scored_products)
     run_store.complete_run(run_id, totals={"total": len(products), **snapshot_totals})
 
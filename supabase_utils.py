@@ -9,15 +9,15 @@ import hashlib
 import json
 import logging
 import os
-from dataclasses import asdict
 from datetime import datetime
 from typing import Iterable, Optional
 from urllib.parse import urlparse
 from uuid import UUID, uuid4
 
+from postgrest import ReturnMethod
 from supabase import Client, create_client
 
-from gumroad_scraper import Product
+from gumroad_scraper import Product, product_to_dict
 from models import estimate_revenue
 
 
@@ -34,6 +34,29 @@ def sanitize_for_json(data: dict) -> dict:
     return sanitized
 
 
+# Rows per upsert request; keeps large runs well under PostgREST's body limit
+UPSERT_BATCH_SIZE = 500
+
+
+def _upsert_in_batches(client: Client, table: str, rows: list[dict], on_conflict: str) -> int:
+    """Upsert ``rows`` in batches and return how many were written.
+
+    Rows are not echoed back (``return=minimal``): callers only need the
+    count, and the echo would double the data sent over the wire.
+    """
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        (
+            client.table(table)
+            .upsert(
+                rows[start:start + UPSERT_BATCH_SIZE],
+                on_conflict=on_conflict,
+                returning=ReturnMethod.minimal,
+            )
+            .execute()
+        )
+    return len(rows)
+
+
 def _compute_snapshot_hash(snapshot: dict) -> str:
     serializable = snapshot.copy()
     serializable.pop("raw_source_hash", None)
@@ -47,7 +70,7 @@ def _build_snapshot_payload(
     platform_product_id: str,
     scraped_at: str,
 ) -> dict:
-    payload = asdict(product)
+    payload = product_to_dict(product)
     revenue_estimate, revenue_confidence = estimate_revenue(
         payload.get("price_usd"),
         payload.get("sales_count"),
@@ -304,12 +327,9 @@ class SupabaseRunStore:
         if not snapshots:
             return {"inserted": 0, "updated": 0, "unchanged": 0}
 
-        response = (
-            self.client.table("product_snapshots")
-            .upsert(snapshots, on_conflict="platform,product_id,run_id")
-            .execute()
+        inserted = _upsert_in_batches(
+            self.client, "product_snapshots", snapshots, on_conflict="platform,product_id,run_id"
         )
-        inserted = len(response.data)
         return {"inserted": inserted, "updated": 0, "unchanged": 0}
 
     def fetch_snapshots(
@@ -394,7 +414,7 @@ class SupabasePersistence:
         now = datetime.utcnow().isoformat()
         records = []
         for product in products:
-            payload = sanitize_for_json(asdict(product))
+            payload = sanitize_for_json(product_to_dict(product))
             revenue_estimate, revenue_confidence = estimate_revenue(
                 payload.get("price_usd"),
                 payload.get("sales_count"),
@@ -439,12 +459,9 @@ class SupabasePersistence:
         if not records:
             return {"inserted": 0, "updated": 0, "unchanged": 0}
 
-        response = (
-            self.client.table("products")
-            .upsert(records, on_conflict="platform_id,platform_product_id")
-            .execute()
+        inserted = _upsert_in_batches(
+            self.client, "products", records, on_conflict="platform_id,platform_product_id"
         )
-        inserted = len(response.data)
         return {"inserted": inserted, "updated": 0, "unchanged": 0}
 
 
@@ -2,7 +2,9 @@
 Unit tests for opportunity scoring and delta detection.
 """
 
+import sqlite3
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
@@ -18,7 +20,10 @@ from opportunity_scoring import (
 )
 from alerts import (
     init_database,
+    get_connection,
+    close_connections,
     create_saved_search,
+    get_saved_search,
     get_saved_searches,
     delete_saved_search,
     add_to_watchlist,
@@ -32,7 +37,9 @@ from alerts import (
     detect_rating_changes,
     detect_sales_changes,
     detect_all_changes,
+    check_for_updates,
     ProductSnapshot,
+    SQLITE_MAX_VARIABLES,
 )
 
 
@@ -324,6 +331,75 @@ class TestDeltaDetection(unittest.TestCase):
         self.assertIn('new', change_types)
         self.assertIn('price_change', change_types)
 
+        # All changes from one pass share a single detection timestamp
+        self.assertEqual(len({c.detected_at for c in changes}), 1)
+
+    def test_detect_all_changes_matches_individual_detectors(self):
+        """Test that the combined pass agrees with the individual detectors."""
+        count = 1050
+        previous = []
+        current = []
+        for i in range(count):
+            url = f'https://gumroad.com/l/bulk{i}'
+            previous.append(ProductSnapshot(
+                product_url=url,
+                product_name=f'Bulk {i}',
+                price_usd=[0.0, 10.0, None, 25.0][i % 4],
+                average_rating=[4.0, None, 3.5][i % 3],
+                total_reviews=10,
+                sales_count=[0, 100, None, 40, 7][i % 5],
+                estimated_revenue=None,
+                opportunity_score=None,
+                snapshot_at='2024-01-01T00:00:00',
+            ))
+            current.append({
+                'product_url': url if i % 7 else f'{url}-new',
+                'product_name': f'Bulk {i}',
+                'price_usd': [0.0, 10.4, 5.0, None, 26.5][i % 5] if i % 7 else 9.99,
+                'average_rating': [4.3, 4.1, None, 3.6][i % 4],
+                'sales_count': [0, 112, 5, None, 44, 100][i % 6],
+            })
+
+        expected = (
+            detect_new_products(current, previous)
+            + detect_price_changes(current, previous)
+            + detect_rating_changes(current, previous)
+            + detect_sales_changes(current, previous)
+        )
+        changes = detect_all_changes(current, previous)
+
+        def key(change):
+            return (change.product_url, change.change_type, change.old_value, change.new_value)
+
+        self.assertEqual([key(c) for c in changes], [key(c) for c in expected])
+
+    def test_detect_all_changes_honours_custom_thresholds(self):
+        """Test that non-default thresholds reach every detector."""
+        current = [
+            {'product_url': 'https://gumroad.com/l/product1', 'product_name': 'Product 1',
+             'price_usd': 30.99, 'average_rating': 4.65, 'total_reviews': 50, 'sales_count': 1030},
+            {'product_url': 'https://gumroad.com/l/product2', 'product_name': 'Product 2',
+             'price_usd': 19.99, 'average_rating': 4.0, 'total_reviews': 30, 'sales_count': 500},
+        ]
+
+        self.assertEqual(detect_all_changes(current, self.previous_snapshot), [])
+
+        changes = detect_all_changes(
+            current,
+            self.previous_snapshot,
+            price_threshold_percent=3.0,
+            rating_threshold=0.1,
+            sales_threshold_percent=2.0,
+        )
+        self.assertEqual(
+            [(c.product_url, c.change_type) for c in changes],
+            [
+                ('https://gumroad.com/l/product1', 'price_change'),
+                ('https://gumroad.com/l/product1', 'rating_change'),
+                ('https://gumroad.com/l/product1', 'sales_change'),
+            ],
+        )
+
     def test_empty_previous_snapshot(self):
         """Test detection when previous snapshot is empty (all products are new)."""
         current = [
@@ -349,6 +425,7 @@ class TestAlertsPersistence(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary database."""
+        close_connections()
         import gc
         gc.collect()  # Force garbage collection to release file handles
         try:
@@ -446,6 +523,30 @@ class TestAlertsPersistence(unittest.TestCase):
         self.assertEqual(len(snapshot), 2)
         self.assertEqual(snapshot[0].product_name, 'Product 1')
 
+        # Only one snapshot exists, so there is nothing to compare against
+        self.assertEqual(get_previous_snapshot(search.id, self.db_path), [])
+
+        # Snapshot and last_checked_at share the same timestamp
+        searches = get_saved_searches(self.db_path)
+        self.assertEqual(searches[0].last_checked_at, snapshot[0].snapshot_at)
+
+    def test_save_snapshot_spans_multiple_insert_chunks(self):
+        """Test that snapshots larger than one INSERT statement are saved in order."""
+        search = create_saved_search("Test", "design", db_path=self.db_path)
+        products = [
+            {'product_url': f'https://gumroad.com/l/bulk{i}', 'product_name': f'Bulk {i}',
+             'price_usd': float(i)}
+            for i in range(SQLITE_MAX_VARIABLES // 10 + 25)
+        ]
+
+        self.assertEqual(save_snapshot(search.id, products, self.db_path), len(products))
+
+        snapshot = get_latest_snapshot(search.id, self.db_path)
+        self.assertEqual(
+            [s.product_url for s in snapshot],
+            [p['product_url'] for p in products],
+        )
+
     def test_multiple_snapshots(self):
         """Test getting previous snapshot when multiple exist."""
         search = create_saved_search("Test", "design", db_path=self.db_path)
@@ -481,6 +582,138 @@ class TestAlertsPersistence(unittest.TestCase):
         self.assertEqual(len(previous), 1)
         self.assertEqual(previous[0].price_usd, 29.99)
 
+    def test_check_for_updates_matches_pure_detection(self):
+        """Test that the SQL join path reports the same changes as detect_all_changes."""
+        search = create_saved_search("Test", "design", db_path=self.db_path)
+        baseline = [
+            {'product_url': 'https://gumroad.com/l/p1', 'product_name': 'Product 1',
+             'price_usd': 29.99, 'average_rating': 4.5, 'total_reviews': 50, 'sales_count': 1000},
+            {'product_url': 'https://gumroad.com/l/p2', 'product_name': 'Product 2',
+             'price_usd': 19.99, 'average_rating': 4.0, 'total_reviews': 30, 'sales_count': 500},
+        ]
+        save_snapshot(search.id, baseline, self.db_path)
+
+        current = [
+            {'product_url': 'https://gumroad.com/l/p1', 'product_name': 'Product 1',
+             'price_usd': 49.99, 'average_rating': 4.8, 'total_reviews': 60, 'sales_count': 1200},
+            {'product_url': 'https://gumroad.com/l/p2', 'product_name': 'Product 2',
+             'price_usd': 19.99, 'average_rating': 4.0, 'total_reviews': 30, 'sales_count': 500},
+            {'product_url': 'https://gumroad.com/l/p3', 'product_name': 'Product 3',
+             'price_usd': 9.99},
+        ]
+        expected = detect_all_changes(current, get_latest_snapshot(search.id, self.db_path))
+        changes = check_for_updates(search.id, current, self.db_path)
+
+        def key(c):
+            return (c.product_url, c.change_type, c.old_value, c.new_value)
+
+        self.assertEqual([key(c) for c in changes], [key(c) for c in expected])
+        self.assertEqual(
+            {c.change_type for c in changes},
+            {'new', 'price_change', 'rating_change', 'sales_change'},
+        )
+
+    def test_connection_uses_wal_journal(self):
+        """Test that connections are opened in WAL mode with relaxed sync."""
+        conn = get_connection(self.db_path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        self.assertEqual(journal_mode.lower(), 'wal')
+        self.assertEqual(synchronous, 1)  # NORMAL
+
+    def test_connection_is_shared_across_threads(self):
+        """Test that every thread gets the same shared connection."""
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(get_connection(self.db_path)))
+        worker.start()
+        worker.join()
+
+        self.assertIs(seen[0], get_connection(self.db_path))
+
+    def test_concurrent_writes_from_threads(self):
+        """Test that CRUD calls from several threads all land."""
+        def create(i):
+            create_saved_search(name=f"Thread {i}", category="design", db_path=self.db_path)
+
+        workers = [threading.Thread(target=create, args=(i,)) for i in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(len(get_saved_searches(self.db_path)), 8)
+
+    def test_existing_database_gets_current_indexes(self):
+        """Test that a database created before the composite indexes is migrated."""
+        legacy_path = self.db_path.with_name(self.db_path.stem + '_legacy.db')
+        self.addCleanup(legacy_path.unlink, missing_ok=True)
+        legacy = sqlite3.connect(str(legacy_path))
+        legacy.execute(
+            "CREATE TABLE product_snapshots (id INTEGER PRIMARY KEY, search_id INTEGER, "
+            "product_url TEXT NOT NULL, product_name TEXT NOT NULL, price_usd REAL, "
+            "average_rating REAL, total_reviews INTEGER, sales_count INTEGER, "
+            "estimated_revenue REAL, opportunity_score REAL, snapshot_at TEXT NOT NULL)"
+        )
+        legacy.execute("CREATE INDEX idx_snapshots_search_id ON product_snapshots(search_id)")
+        legacy.commit()
+        legacy.close()
+
+        conn = get_connection(legacy_path)
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'product_snapshots'"
+        )}
+
+        self.assertIn('idx_snap_search_time', indexes)
+        self.assertIn('idx_snap_search_url', indexes)
+        self.assertNotIn('idx_snapshots_search_id', indexes)
+
+    def test_snapshot_writes_gather_statistics(self):
+        """Test that planner statistics are gathered when the connection closes."""
+        search = create_saved_search(name="Stats", category="design", db_path=self.db_path)
+        products = [
+            {'product_url': f'https://gumroad.com/l/p{i}', 'product_name': f'P{i}', 'price_usd': 5.0}
+            for i in range(50)
+        ]
+        check_for_updates(search.id, products, self.db_path)
+        close_connections()
+
+        conn = get_connection(self.db_path)
+        stats = conn.execute(
+            "SELECT idx FROM sqlite_stat1 WHERE tbl = 'product_snapshots'"
+        ).fetchall()
+        self.assertTrue(stats)
+
+    def test_snapshot_writes_do_not_optimize(self):
+        """Test that saving a snapshot leaves statistics to periodic maintenance."""
+        search = create_saved_search(name="No stats", category="design", db_path=self.db_path)
+        products = [
+            {'product_url': f'https://gumroad.com/l/p{i}', 'product_name': f'P{i}', 'price_usd': 5.0}
+            for i in range(50)
+        ]
+        save_snapshot(search.id, products, self.db_path)
+
+        conn = get_connection(self.db_path)
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        self.assertIsNone(has_stats)
+
+    def test_failed_write_rolls_back(self):
+        """Test that a failed write leaves no partial rows or open transaction."""
+        search = create_saved_search(name="Rollback", category="design", db_path=self.db_path)
+        products = [
+            {'product_url': 'https://gumroad.com/l/ok', 'product_name': 'OK', 'price_usd': 5.0},
+            {'product_url': 'https://gumroad.com/l/bad', 'product_name': None, 'price_usd': 5.0},
+        ]
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            save_snapshot(search.id, products, self.db_path)
+
+        self.assertFalse(get_connection(self.db_path).in_transaction)
+        self.assertEqual(get_latest_snapshot(search.id, self.db_path), [])
+        self.assertIsNone(get_saved_search(search.id, self.db_path).last_checked_at)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -47,3 +47,11 @@ def test_analyzer_requires_products():
     analyzer = CrewAnalyzer(crew_builder=lambda _tasks: None)
     with pytest.raises(ValueError):
         analyzer.analyze([], dataset_id="empty", source_label="none")
+
+
+def test_dataset_cache_key_ignores_key_order():
+    key1 = dataset_cache_key([{"product_name": "A", "price_usd": 10}], "alpha")
+    key2 = dataset_cache_key([{"price_usd": 10, "product_name": "A"}], "alpha")
+
+    assert key1 == key2
+    assert key1 != dataset_cache_key([{"product_name": "A", "price_usd": 10}], "beta")
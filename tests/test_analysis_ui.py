@@ -1,8 +1,11 @@
 import types
 from dataclasses import dataclass
 
+import pandas as pd
+
 import analysis_ui
 from analysis_engine import AnalysisResult
+from gumroad_scraper import Product, product_to_dict
 
 
 def test_to_rows_handles_dataclasses_and_dicts():
@@ -18,6 +21,34 @@ def test_to_rows_handles_dataclasses_and_dicts():
     ]
 
 
+def test_to_rows_uses_product_to_dict_for_products():
+    product = Product(
+        product_name="UI Kit",
+        creator_name="Creator",
+        category="design",
+        subcategory="",
+        price_usd=12.5,
+        original_price="$12.50",
+        price_is_pwyw=False,
+        currency="USD",
+        average_rating=4.5,
+        total_reviews=10,
+        rating_1_star=None,
+        rating_2_star=None,
+        rating_3_star=None,
+        rating_4_star=None,
+        rating_5_star=None,
+        mixed_review_count=None,
+        mixed_review_percent=None,
+        sales_count=40,
+        estimated_revenue=500.0,
+        revenue_confidence="medium",
+        product_url="https://creator.gumroad.com/l/kit",
+    )
+
+    assert analysis_ui._to_rows(iter([product])) == [product_to_dict(product)]
+
+
 def test_render_result_uses_streamlit_primitives(monkeypatch):
     calls = []
 
@@ -81,3 +112,12 @@ def test_render_result_uses_streamlit_primitives(monkeypatch):
     labels = [call[0] for call in calls]
     assert "subheader" in labels
     assert ("json", {"raw": True}) in calls
+
+
+def test_frame_cache_key_tracks_content():
+    frame = pd.DataFrame({"name": ["One", "Two"], "price": [10.0, None]})
+    key = analysis_ui._frame_cache_key(frame, "demo")
+
+    assert key == analysis_ui._frame_cache_key(frame.copy(), "demo")
+    assert key != analysis_ui._frame_cache_key(frame, "other")
+    assert key != analysis_ui._frame_cache_key(frame.assign(price=[10.0, 20.0]), "demo")
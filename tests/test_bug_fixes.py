@@ -11,6 +11,7 @@ from gumroad_scraper import (
     parse_rating,
     extract_sales_from_page,
     Product,
+    product_to_dict,
 )
 from supabase_utils import sanitize_for_json
 
@@ -79,6 +80,9 @@ class TestTimestampSerialization(unittest.TestCase):
         self.assertIsInstance(payload["scraped_at"], str)
         self.assertIn("T", payload["scraped_at"])  # ISO format has T separator
 
+        # The shallow field copy used for persistence matches asdict()
+        self.assertEqual(product_to_dict(product), asdict(product))
+
 
 class TestWishlistFiltering(unittest.TestCase):
     """Tests for BUG 2: Wishlist URLs being scraped."""
@@ -4,6 +4,8 @@ from categories import (
     should_skip_subcategory,
     Subcategory,
     CATEGORY_TREE,
+    SUBCATEGORY_LABELS,
+    SUBCATEGORY_SLUGS,
 )
 
 
@@ -127,3 +129,21 @@ def test_backwards_compatibility_with_subcategory_slug():
     
     # Invalid subcategories should fall back to category-only
     assert build_discover_url("3d", subcategory_slug="assets") == "https://gumroad.com/3d"
+
+
+def test_subcategory_lookups_match_tree():
+    for category in CATEGORY_TREE:
+        assert SUBCATEGORY_LABELS[category.label] == tuple(sub.label for sub in category.subcategories)
+        for sub in category.subcategories:
+            assert SUBCATEGORY_SLUGS[category.label][sub.label] == sub.slug
+
+
+def test_slug_only_urls_are_memoized():
+    from categories import _slug_discover_url
+
+    _slug_discover_url.cache_clear()
+    assert build_discover_url("design", "") == build_discover_url("design") == "https://gumroad.com/design"
+    assert build_discover_url("design", "icons") == "https://gumroad.com/design/icons"
+    assert build_discover_url("design", "icons") == "https://gumroad.com/design/icons"
+    info = _slug_discover_url.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
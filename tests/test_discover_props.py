@@ -0,0 +1,53 @@
+from pathlib import Path
+import unittest
+
+from gumroad_scraper import _proxy_url, parse_discover_props, product_from_discover_props
+
+
+class DiscoverPropsTests(unittest.TestCase):
+    def setUp(self):
+        fixture_path = Path(__file__).parent / "fixtures" / "discover_props.html"
+        self.html = fixture_path.read_text()
+
+    def test_products_follow_page_order(self):
+        items, complete = parse_discover_props(self.html)
+
+        self.assertEqual([item["name"] for item in items], ["Font Bundle", "Icon Pack", "Brush Set"])
+        # Two search results out of a total of three: more need scrolling
+        self.assertFalse(complete)
+
+    def test_missing_props_returns_none(self):
+        self.assertIsNone(parse_discover_props("<html><body>No props</body></html>"))
+
+    def test_product_from_props_matches_card_fields(self):
+        items, _ = parse_discover_props(self.html)
+        free, usd, pwyw_eur = (product_from_discover_props(item, "design", "icons") for item in items)
+
+        self.assertEqual(free.original_price, "Free")
+        self.assertEqual(free.description, "Six typefaces")
+
+        self.assertEqual(usd.price_usd, 15.0)
+        self.assertEqual(usd.original_price, "$15")
+        self.assertEqual(usd.average_rating, 4.5)
+        self.assertEqual(usd.total_reviews, 12)
+        self.assertEqual(usd.creator_name, "Studio A")
+        self.assertEqual((usd.category, usd.subcategory), ("design", "icons"))
+        self.assertIsNone(usd.sales_count)
+
+        self.assertTrue(pwyw_eur.price_is_pwyw)
+        self.assertEqual(pwyw_eur.currency, "EUR")
+        self.assertEqual(pwyw_eur.original_price, "10 EUR+")
+        self.assertEqual(pwyw_eur.price_usd, 11.0)
+        self.assertIsNone(pwyw_eur.average_rating)
+
+    def test_proxy_url_round_trips_credentials(self):
+        self.assertEqual(
+            _proxy_url({"server": "http://proxy:8080", "username": "u", "password": "p"}),
+            "http://u:p@proxy:8080",
+        )
+        self.assertEqual(_proxy_url({"server": "proxy:3128"}), "http://proxy:3128")
+        self.assertIsNone(_proxy_url(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,15 @@
+import itertools
 from datetime import datetime, timedelta, timezone
 
-from opportunity_scoring import score_trend_from_snapshots
+import pytest
+
+import opportunity_scoring
+from opportunity_scoring import (
+    VECTORIZE_MIN_ROWS,
+    score_product_dict,
+    score_product_dicts,
+    score_trend_from_snapshots,
+)
 
 
 BASE_TIME = datetime(2024, 1, 15, tzinfo=timezone.utc)
@@ -138,3 +147,29 @@ def test_trend_score_large_deltas_do_not_saturate_immediately():
     ]
     score = score_trend_from_snapshots(snapshots)
     assert score.trend_score < 100.0
+
+
+@pytest.mark.skipif(opportunity_scoring.np is None, reason="numpy not installed")
+def test_score_product_dicts_matches_per_row_scoring():
+    # Cycle through every band boundary, including missing values
+    prices = [0, 4.99, 5, 9.99, 10, 15, 49, 49.5, 79, 79.5, 80, 149, 150, 299, 300]
+    ratings = [None, 3.4, 3.5, 4.0, 4.3, 4.7]
+    reviews = [0, 5, 10, 20, 50, 100]
+    mixed = [None, 15, 25, 40, 40.1]
+    sales = [None, 9, 10, 50, 100, 500, 1000, 5000, 10000]
+    revenue = [None, 999, 1000, 5000, 10000, 20000, 50000, 100000]
+    columns = [itertools.cycle(values) for values in (prices, ratings, reviews, mixed, sales, revenue)]
+    products = [
+        {
+            "product_name": f"Product {i}",
+            "price_usd": next(columns[0]),
+            "average_rating": next(columns[1]),
+            "total_reviews": next(columns[2]),
+            "mixed_review_percent": next(columns[3]),
+            "sales_count": next(columns[4]),
+            "estimated_revenue": next(columns[5]),
+        }
+        for i in range(VECTORIZE_MIN_ROWS * 2)
+    ]
+
+    assert score_product_dicts(products) == [score_product_dict(p) for p in products]
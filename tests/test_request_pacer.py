@@ -0,0 +1,30 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from gumroad_scraper import RequestPacer
+
+
+class TestRequestPacer(IsolatedAsyncioTestCase):
+    async def test_concurrent_waits_are_spaced(self):
+        pacer = RequestPacer(40)
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def request():
+            await pacer.wait()
+            starts.append(loop.time())
+
+        await asyncio.gather(*(request() for _ in range(4)))
+
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        self.assertEqual(len(gaps), 3)
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.035)
+
+    async def test_zero_interval_does_not_wait(self):
+        pacer = RequestPacer(0)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(10):
+            await pacer.wait()
+        self.assertLess(loop.time() - started, 0.05)
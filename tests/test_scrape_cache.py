@@ -0,0 +1,84 @@
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+import scrape_cache
+from gumroad_scraper import Product
+from opportunity_scoring import score_product_dict
+
+pytestmark = pytest.mark.skipif(scrape_cache.pa is None, reason="pyarrow not installed")
+
+
+def _product(name: str, sales: int | None) -> Product:
+    return Product(
+        product_name=name,
+        creator_name="Creator",
+        category="design",
+        subcategory="icons",
+        price_usd=12.5,
+        original_price="$12.50",
+        price_is_pwyw=False,
+        currency="USD",
+        average_rating=4.6,
+        total_reviews=20,
+        rating_1_star=None,
+        rating_2_star=None,
+        rating_3_star=None,
+        rating_4_star=None,
+        rating_5_star=None,
+        mixed_review_count=None,
+        mixed_review_percent=None,
+        sales_count=sales,
+        estimated_revenue=None if sales is None else sales * 12.5,
+        revenue_confidence="medium",
+        product_url=f"https://creator.gumroad.com/l/{name}",
+        scraped_at=datetime(2024, 5, 1, 12, 30),
+    )
+
+
+def _scored(products):
+    return [score_product_dict({f: getattr(p, f) for f in scrape_cache._PRODUCT_FIELDS}) for p in products]
+
+
+def test_round_trip_restores_products_and_scores(tmp_path):
+    products = [_product("alpha", 150), _product("beta", None)]
+    scored = _scored(products)
+    path = scrape_cache.cache_path("design", "icons", 50, False, cache_dir=tmp_path)
+
+    scrape_cache.store_results(path, scored)
+    loaded = scrape_cache.load_results(path)
+
+    assert loaded is not None
+    loaded_products, loaded_scored = loaded
+    assert loaded_products == products
+    assert [row["opportunity_score"] for row in loaded_scored] == [row["opportunity_score"] for row in scored]
+
+
+def test_stale_or_missing_entries_miss(tmp_path):
+    path = scrape_cache.cache_path("design", "", 50, True, cache_dir=tmp_path)
+    assert scrape_cache.load_results(path) is None
+
+    scrape_cache.store_results(path, _scored([_product("alpha", 3)]))
+    old = time.time() - scrape_cache.MAX_AGE_SECONDS - 60
+    os.utime(path, (old, old))
+    assert scrape_cache.load_results(path) is None
+
+
+def test_key_covers_search_inputs_and_discard(tmp_path):
+    path = scrape_cache.cache_path("design", "icons", 50, False, cache_dir=tmp_path)
+    assert path != scrape_cache.cache_path("design", "icons", 100, False, cache_dir=tmp_path)
+    assert path != scrape_cache.cache_path("design", "icons", 50, True, cache_dir=tmp_path)
+
+    scrape_cache.store_results(path, _scored([_product("alpha", 3)]))
+    scrape_cache.discard_results(path)
+    assert scrape_cache.load_results(path) is None
+
+
+def test_empty_results_are_not_cached(tmp_path):
+    path = scrape_cache.cache_path("design", "icons", 50, False, cache_dir=tmp_path)
+    scrape_cache.store_results(path, [])
+
+    assert not path.exists()
+    assert scrape_cache.load_results(path) is None